@@ -9,23 +9,27 @@ Endpoints:
 - GET /api/v1/health - System health check
 - GET /api/v1/providers/status - AI provider status
 
-Run with: uvicorn app:app --reload
+Run with: uvicorn app:app --reload --loop uvloop --http httptools
 """
 
 import os
+import time
+import asyncio
 import logging
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Final, Optional
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse, StreamingResponse
 from dotenv import load_dotenv
+import orjson
 
-from providers import ProviderConfig
-from services import DecisionOrchestrator
-from models import DecisionRequest, DecisionResponse, DecisionStatus
+from providers import BaseLLMProvider, ProviderConfig, get_global_registry
+from services import DecisionOrchestrator, DecisionStore
+from models import Decision, DecisionRequest, DecisionResponse, DecisionStatus
 
 # Load environment variables
 load_dotenv()
@@ -37,12 +41,18 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Numeric settings are parsed once at import
+CONSENSUS_THRESHOLD: Final[float] = float(os.getenv("CONSENSUS_THRESHOLD", "0.66"))
+
 # Global orchestrator instance
 orchestrator: Optional[DecisionOrchestrator] = None
 
 # In-memory decision storage (will be replaced with database)
-# Format: {decision_id: Decision}
-decision_store: Dict[str, Any] = {}
+# Bounded by size and TTL so it cannot grow without limit
+decision_store = DecisionStore(
+    max_size=int(os.getenv("DECISION_STORE_MAX_SIZE", "10000")),
+    ttl_seconds=float(os.getenv("DECISION_STORE_TTL_SECONDS", "86400"))
+)
 
 
 @asynccontextmanager
@@ -90,15 +100,24 @@ async def lifespan(app: FastAPI):
         anthropic_config=anthropic_config,
         openai_config=openai_config,
         llama_config=llama_config,
-        require_consensus_threshold=float(os.getenv("CONSENSUS_THRESHOLD", "0.66"))
+        require_consensus_threshold=CONSENSUS_THRESHOLD
     )
 
+    # Load local models and open connections in the background, so a slow
+    # or stalled Ollama can't hold up startup (and the health check)
+    prewarm_task = asyncio.create_task(orchestrator.prewarm())
+
     logger.info("✅ TrustChain API ready")
 
     yield  # Server runs here
 
     # Cleanup on shutdown
     logger.info("Shutting down TrustChain API...")
+    prewarm_task.cancel()
+    await asyncio.gather(prewarm_task, return_exceptions=True)
+    await orchestrator.close()
+    await get_global_registry().aclose()
+    await BaseLLMProvider.aclose()
 
 
 # Create FastAPI application
@@ -106,18 +125,29 @@ app = FastAPI(
     title="TrustChain API",
     description="Multi-model AI decision-making with bias detection and audit trails",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware (allows frontend to call API)
+# Explicit lists let Starlette answer preflights with prebuilt headers
+# instead of echoing whatever the browser asks for
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # In production, restrict to specific origins
+    allow_origins=[
+        origin.strip()
+        for origin in os.getenv("FRONTEND_URL", "http://localhost:3000").split(",")
+        if origin.strip()
+    ],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["content-type", "authorization"],
 )
 
+# Gzip large responses (decision details, listings, FOIA reports);
+# small ones like the health check are sent uncompressed
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 
 # ============================================================================
 # API ENDPOINTS
@@ -160,7 +190,7 @@ async def health_check():
 
     return {
         "status": overall_status,
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": _iso_now(),
         "providers": health_status,
         "decisions_processed": len(decision_store)
     }
@@ -190,11 +220,15 @@ async def provider_status():
         "healthy_providers": health_info["healthy_providers"],
         "overall_health": health_info["overall_health"],
         "providers": health_info["providers"],
-        "timestamp": datetime.now().isoformat()
+        "timestamp": _iso_now()
     }
 
 
-@app.post("/api/v1/decisions", response_model=DecisionResponse, status_code=status.HTTP_201_CREATED)
+@app.post(
+    "/api/v1/decisions",
+    status_code=status.HTTP_201_CREATED,
+    responses={status.HTTP_201_CREATED: {"model": DecisionResponse}}
+)
 async def create_decision(request: DecisionRequest):
     """
     Submit a new decision request.
@@ -240,7 +274,7 @@ async def create_decision(request: DecisionRequest):
         )
 
         # Store decision (in-memory for now, will use database later)
-        decision_store[decision.decision_id] = decision
+        decision_store.add(decision)
 
         logger.info(
             f"✅ Decision complete: {decision.decision_id} - "
@@ -248,17 +282,22 @@ async def create_decision(request: DecisionRequest):
         )
 
         # Build response
-        response = DecisionResponse(
+        # model_construct skips re-validating objects the orchestrator just
+        # built; returning an ORJSONResponse skips response_model validation
+        # and jsonable_encoder, so the dump goes straight to orjson.
+        response = DecisionResponse.model_construct(
             decision_id=decision.decision_id,
             status=decision.status,
             final_decision=decision.final_decision,
             consensus_analysis=decision.consensus_analysis,
             model_decisions=decision.model_decisions,
-            requires_human_review=(decision.status == DecisionStatus.REQUIRES_REVIEW),
+            requires_human_review=decision.status == DecisionStatus.REQUIRES_REVIEW,
             audit_hash=decision.audit_hash
         )
-
-        return response
+        return ORJSONResponse(
+            status_code=status.HTTP_201_CREATED,
+            content=response.model_dump()
+        )
 
     except Exception as e:
         logger.error(f"❌ Decision request failed: {str(e)}", exc_info=True)
@@ -269,7 +308,7 @@ async def create_decision(request: DecisionRequest):
 
 
 @app.get("/api/v1/decisions/{decision_id}")
-async def get_decision(decision_id: str):
+async def get_decision(decision_id: str, verify: bool = False):
     """
     Retrieve a decision by ID.
 
@@ -282,23 +321,29 @@ async def get_decision(decision_id: str):
 
     Args:
         decision_id: Unique decision identifier
+        verify: Recompute the audit hash and report whether it still matches
+            (?verify=true). Skipped by default - the stored hash was computed
+            once when the decision was made.
 
     Returns:
         Complete Decision object
     """
-    if decision_id not in decision_store:
+    decision = decision_store.get(decision_id)
+    if decision is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Decision {decision_id} not found"
         )
 
-    decision = decision_store[decision_id]
-
-    # Verify audit hash
-    hash_valid = decision.verify_audit_hash()
+    # Verify audit hash only on request - recomputing it re-serializes every
+    # model decision. Deliberately not memoized: a cached result would hide
+    # tampering, which is exactly what verification exists to catch.
+    hash_valid = (
+        await asyncio.to_thread(decision.verify_audit_hash) if verify else None
+    )
 
     return {
-        "decision": decision.dict(),
+        "decision": decision.model_dump(),
         "audit_verified": hash_valid,
         "foia_report": decision.to_foia_report()
     }
@@ -319,75 +364,100 @@ async def list_decisions(
         limit: Max results to return (default 100)
 
     Returns:
-        List of decision summaries
+        List of decision summaries, newest first
     """
-    decisions = list(decision_store.values())
-
-    # Apply filters
-    if status_filter:
-        decisions = [d for d in decisions if d.status.value == status_filter]
+    # Walks recent decisions newest-first and stops at `limit`
+    decisions = decision_store.query(
+        status=status_filter,
+        decision_type=decision_type,
+        limit=limit
+    )
 
-    if decision_type:
-        decisions = [d for d in decisions if d.decision_type == decision_type]
+    # Return summaries (not full details), serialized one row at a time so
+    # the first bytes go out before the whole list is encoded
+    header = orjson.dumps({"total": len(decision_store), "filtered": len(decisions)})
 
-    # Limit results
-    decisions = decisions[:limit]
+    # Async, so Starlette iterates it on the event loop instead of moving
+    # to the threadpool for every piece
+    async def stream_summaries():
+        yield header[:-1] + b',"decisions":['
+        for i, d in enumerate(decisions):
+            row = orjson.dumps(_decision_summary(d))
+            yield b"," + row if i else row
+        yield b"]}"
 
-    # Return summaries (not full details)
-    return {
-        "total": len(decision_store),
-        "filtered": len(decisions),
-        "decisions": [
-            {
-                "decision_id": d.decision_id,
-                "case_id": d.case_id,
-                "decision_type": d.decision_type,
-                "final_decision": d.final_decision.value if d.final_decision else None,
-                "status": d.status.value,
-                "created_at": d.created_at.isoformat(),
-                "requires_review": d.status == DecisionStatus.REQUIRES_REVIEW,
-                "consensus_level": d.consensus_analysis.agreement_level if d.consensus_analysis else None
-            }
-            for d in decisions
-        ]
-    }
+    return StreamingResponse(stream_summaries(), media_type="application/json")
 
 
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
 
-def _format_prompt(request: DecisionRequest) -> str:
+# (epoch second, ISO string) - monitoring endpoints don't need sub-second precision
+_timestamp_cache = (0, "")
+
+
+def _iso_now() -> str:
     """
-    Format input data into a prompt for AI models.
+    Current local time as an ISO string, cached per second.
 
-    This creates a human-readable case description from structured data.
+    Used by health/status/error responses so high-QPS polling doesn't
+    rebuild the same string on every call. Decision timestamps still use
+    datetime.now() for full resolution.
     """
-    # Extract key fields based on decision type
-    if request.decision_type == "unemployment_benefits":
-        return f"""
-Unemployment Benefits Application - Case #{request.case_id}
+    global _timestamp_cache
+    now = int(time.time())
+    if now != _timestamp_cache[0]:
+        _timestamp_cache = (now, datetime.fromtimestamp(now).isoformat())
+    return _timestamp_cache[1]
+
+
+def _decision_summary(d: Decision) -> dict:
+    """Summary fields for a decision in list responses (not full details)."""
+    # Status/outcome enums are str subclasses - orjson encodes them as
+    # their values, so no .value lookups per row
+    return {
+        "decision_id": d.decision_id,
+        "case_id": d.case_id,
+        "decision_type": d.decision_type,
+        "final_decision": d.final_decision,
+        "status": d.status,
+        "created_at": d.created_at.isoformat(),
+        "requires_review": d.status == DecisionStatus.REQUIRES_REVIEW,
+        "consensus_level": d.consensus_analysis.agreement_level if d.consensus_analysis else None
+    }
+
+
+# Prompt templates are built once at import; _format_prompt only fills them in
+_UNEMPLOYMENT_PROMPT = """
+Unemployment Benefits Application - Case #{case_id}
 
 Applicant Details:
-- Employment Duration: {request.input_data.get('employment_duration_months', 'N/A')} months
-- Reason for Separation: {request.input_data.get('termination_reason', 'N/A')}
-- Prior Annual Earnings: ${request.input_data.get('prior_earnings_annual', 'N/A')}
-- Available for Work: {request.input_data.get('available_for_work', 'N/A')}
-- Actively Seeking Work: {request.input_data.get('actively_seeking_work', 'N/A')}
-- Has Refused Suitable Work: {request.input_data.get('refused_suitable_work', False)}
+- Employment Duration: {employment_duration_months} months
+- Reason for Separation: {termination_reason}
+- Prior Annual Earnings: ${prior_earnings_annual}
+- Available for Work: {available_for_work}
+- Actively Seeking Work: {actively_seeking_work}
+- Has Refused Suitable Work: {refused_suitable_work}
 
 Please evaluate this application and provide:
 1. Your decision (APPROVE or DENY)
 2. Step-by-step reasoning based on eligibility criteria
 3. Your confidence level in this decision
-"""
+""".format
 
-    # Generic format for other decision types
-    else:
-        formatted_data = "\n".join([f"- {k}: {v}" for k, v in request.input_data.items()])
-        return f"""
-Decision Request - Case #{request.case_id}
-Type: {request.decision_type}
+_UNEMPLOYMENT_DEFAULTS = {
+    'employment_duration_months': 'N/A',
+    'termination_reason': 'N/A',
+    'prior_earnings_annual': 'N/A',
+    'available_for_work': 'N/A',
+    'actively_seeking_work': 'N/A',
+    'refused_suitable_work': False,
+}
+
+_GENERIC_PROMPT = """
+Decision Request - Case #{case_id}
+Type: {decision_type}
 
 Case Details:
 {formatted_data}
@@ -396,7 +466,31 @@ Please evaluate this case and provide:
 1. Your decision
 2. Step-by-step reasoning
 3. Your confidence level
-"""
+""".format
+
+_format_field = "- {0[0]}: {0[1]}".format
+
+
+def _format_prompt(request: DecisionRequest) -> str:
+    """
+    Format input data into a prompt for AI models.
+
+    This creates a human-readable case description from structured data.
+    """
+    # Extract key fields based on decision type
+    if request.decision_type == "unemployment_benefits":
+        # case_id goes last so input_data can never override it
+        return _UNEMPLOYMENT_PROMPT(
+            **{**_UNEMPLOYMENT_DEFAULTS, **request.input_data, 'case_id': request.case_id}
+        )
+
+    # Generic format for other decision types
+    else:
+        return _GENERIC_PROMPT(
+            case_id=request.case_id,
+            decision_type=request.decision_type,
+            formatted_data="\n".join(map(_format_field, request.input_data.items()))
+        )
 
 
 # ============================================================================
@@ -412,7 +506,7 @@ async def global_exception_handler(request, exc):
         content={
             "error": "Internal server error",
             "message": str(exc),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _iso_now()
         }
     )
 
@@ -426,5 +520,7 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         reload=True,  # Auto-reload on code changes (development only)
+        loop="uvloop",  # Requires uvicorn[standard]; fails loudly if missing
+        http="httptools",
         log_level="info"
     )
@@ -5,12 +5,38 @@ Defines the data structures for government decisions, consensus outcomes,
 and FOIA-compliant audit trails.
 """
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+import orjson
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from enum import Enum
 import hashlib
-import json
+import math
+
+
+def _has_non_finite(value: Any) -> bool:
+    """Return True if value holds a NaN or infinite float."""
+    if isinstance(value, dict):
+        return any(_has_non_finite(item) for item in value.values())
+    if isinstance(value, list):
+        return any(_has_non_finite(item) for item in value)
+    return isinstance(value, float) and not math.isfinite(value)
+
+
+def _check_audit_serializable(value: Any) -> None:
+    """
+    Raise ValueError if value cannot be hashed into the audit trail.
+
+    orjson rejects integers beyond 64 bits, lone surrogates and nesting
+    deeper than 254 levels; it silently writes NaN/Infinity as null, so
+    those are rejected separately to keep the hash faithful to the input.
+    """
+    try:
+        orjson.dumps(value)
+    except orjson.JSONEncodeError as e:
+        raise ValueError(f"input_data cannot be serialized: {e}") from e
+    if _has_non_finite(value):
+        raise ValueError("input_data must not contain NaN or Infinity")
 
 
 class DecisionStatus(str, Enum):
@@ -47,8 +73,9 @@ class ModelDecision(BaseModel):
     latency_ms: Optional[float] = Field(None, description="Response time in milliseconds")
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        protected_namespaces=(),  # model_provider/model_name are domain fields
+        json_schema_extra={
             "example": {
                 "model_provider": "anthropic",
                 "model_name": "claude-3-opus-20240229",
@@ -60,6 +87,7 @@ class ModelDecision(BaseModel):
                 "latency_ms": 2340.5
             }
         }
+    )
 
 
 class ConsensusAnalysis(BaseModel):
@@ -75,15 +103,16 @@ class ConsensusAnalysis(BaseModel):
     confidence_variance: float = Field(..., description="Variance in confidence scores")
     reasoning_divergence: Optional[str] = Field(None, description="Analysis of reasoning differences")
 
-    @validator('agreement_level')
+    @field_validator('agreement_level')
+    @classmethod
     def validate_agreement(cls, v):
         """Ensure agreement level is in valid range."""
         if not 0.0 <= v <= 1.0:
             raise ValueError("Agreement level must be between 0 and 1")
         return v
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "agreement_level": 0.85,
                 "majority_decision": "approved",
@@ -92,6 +121,7 @@ class ConsensusAnalysis(BaseModel):
                 "reasoning_divergence": None
             }
         }
+    )
 
 
 class BiasDetection(BaseModel):
@@ -107,8 +137,8 @@ class BiasDetection(BaseModel):
     confidence: float = Field(..., ge=0.0, le=1.0, description="Confidence in bias detection")
     recommendation: Optional[str] = Field(None, description="Recommended action")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "bias_detected": False,
                 "bias_type": None,
@@ -117,6 +147,7 @@ class BiasDetection(BaseModel):
                 "recommendation": None
             }
         }
+    )
 
 
 class Decision(BaseModel):
@@ -156,8 +187,9 @@ class Decision(BaseModel):
     foia_compliant: bool = Field(default=True, description="Whether decision meets FOIA requirements")
     audit_hash: Optional[str] = Field(None, description="Cryptographic hash for audit trail")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        protected_namespaces=(),  # model_decisions is a field, not a pydantic API
+        json_schema_extra={
             "example": {
                 "decision_id": "dec_2025_001234",
                 "case_id": "unemp_app_987654",
@@ -172,6 +204,7 @@ class Decision(BaseModel):
                 "final_decision": "approved"
             }
         }
+    )
 
     def calculate_audit_hash(self) -> str:
         """
@@ -201,11 +234,9 @@ class Decision(BaseModel):
             "timestamp": self.created_at.isoformat()
         }
 
-        # Create deterministic JSON string
-        canonical_json = json.dumps(audit_data, sort_keys=True)
-
-        # Calculate SHA-256 hash
-        hash_obj = hashlib.sha256(canonical_json.encode())
+        # orjson returns sorted-key bytes directly - no str round-trip before hashing
+        canonical_bytes = orjson.dumps(audit_data, option=orjson.OPT_SORT_KEYS)
+        hash_obj = hashlib.sha256(canonical_bytes)
         return hash_obj.hexdigest()
 
     def verify_audit_hash(self) -> bool:
@@ -259,8 +290,15 @@ class DecisionRequest(BaseModel):
     require_consensus: bool = Field(default=True, description="Whether to require model consensus")
     applicant_id: Optional[str] = Field(None, description="Anonymized applicant ID")
 
-    class Config:
-        json_schema_extra = {
+    @field_validator('input_data')
+    @classmethod
+    def validate_input_data(cls, v):
+        """Ensure input_data can be serialized for the audit hash."""
+        _check_audit_serializable(v)
+        return v
+
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "case_id": "unemp_app_987654",
                 "decision_type": "unemployment_benefits",
@@ -274,6 +312,7 @@ class DecisionRequest(BaseModel):
                 "require_consensus": True
             }
         }
+    )
 
 
 class DecisionResponse(BaseModel):
@@ -290,8 +329,9 @@ class DecisionResponse(BaseModel):
     requires_human_review: bool
     audit_hash: str
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        protected_namespaces=(),  # model_decisions is a field, not a pydantic API
+        json_schema_extra={
             "example": {
                 "decision_id": "dec_2025_001234",
                 "status": "completed",
@@ -305,3 +345,4 @@ class DecisionResponse(BaseModel):
                 "audit_hash": "a1b2c3d4e5f6..."
             }
         }
+    )
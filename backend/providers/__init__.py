@@ -38,6 +38,7 @@ Custom Providers:
 
 from .base import (
     BaseLLMProvider,
+    BatchRequest,
     LLMResponse,
     ModelProvider,
     ProviderConfig,
@@ -45,25 +46,57 @@ from .base import (
     ProviderException
 )
 
+from .cache import (
+    CacheBackend,
+    InMemoryCacheBackend,
+    RedisCacheBackend,
+    LLMCache
+)
+from .semantic_cache import SemanticCache
+
 from .registry import (
     ProviderRegistry,
     get_global_registry,
     register_provider
 )
 
-from .anthropic_provider import AnthropicProvider
-from .openai_provider import OpenAIProvider
-from .llama_provider import LlamaProvider
+# Built-in providers are imported on first access (PEP 562), so importing
+# the package doesn't load every provider SDK
+_LAZY_PROVIDERS = {
+    "AnthropicProvider": ".anthropic_provider",
+    "OpenAIProvider": ".openai_provider",
+    "LlamaProvider": ".llama_provider",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_PROVIDERS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    provider_class = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = provider_class  # Later lookups skip __getattr__
+    return provider_class
 
 __all__ = [
     # Base classes and types
     "BaseLLMProvider",
+    "BatchRequest",
     "LLMResponse",
     "ModelProvider",
     "ProviderConfig",
     "ProviderStatus",
     "ProviderException",
 
+    # Response caching
+    "CacheBackend",
+    "InMemoryCacheBackend",
+    "RedisCacheBackend",
+    "LLMCache",
+    "SemanticCache",
+
     # Registry
     "ProviderRegistry",
     "get_global_registry",
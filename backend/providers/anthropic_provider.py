@@ -5,23 +5,45 @@ Implements the Anthropic API integration with production-ready error handling,
 response parsing, and government compliance features.
 """
 
-from typing import Optional, Dict, Any
-from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from datetime import datetime, timezone
+from time import perf_counter
+import asyncio
 import logging
-
-from anthropic import AsyncAnthropic, APIError, APIConnectionError, RateLimitError
+import re
+
+import httpx
+from anthropic import (
+    AsyncAnthropic,
+    APIError,
+    APIConnectionError,
+    APIStatusError,
+    APITimeoutError,
+    RateLimitError
+)
 from anthropic.types import Message
 
+from .cache import LLMCache
 from .base import (
+    CERTAINTY_MARKERS_RE,
+    UNCERTAINTY_MARKERS_RE,
     BaseLLMProvider,
+    BatchRequest,
     LLMResponse,
     ModelProvider,
     ProviderConfig,
-    ProviderException
+    ProviderException,
+    count_distinct_markers,
+    get_shared_http_client,
+    parse_retry_after,
+    truncate_for_log
 )
 
 logger = logging.getLogger(__name__)
 
+# Beta header enabling prompt caching of the system context
+PROMPT_CACHING_BETA = "prompt-caching-2024-07-31"
+
 
 class AnthropicProvider(BaseLLMProvider):
     """
@@ -38,10 +60,19 @@ class AnthropicProvider(BaseLLMProvider):
     CLAUDE_SONNET_35 = "claude-3-5-sonnet-20241022"  # Sonnet 3.5
     CLAUDE_HAIKU = "claude-3-haiku-20240307"
 
+    # Response markers, compiled once so each response is scanned in a
+    # single case-insensitive pass per marker group
+    _REASONING_RE = re.compile(
+        r"let me think through this|here's my reasoning:|step-by-step analysis:"
+        r"|my analysis:|reasoning:",
+        re.IGNORECASE
+    )
+
     def __init__(
         self,
         config: ProviderConfig,
-        model: str = CLAUDE_HAIKU  # Changed to Haiku - most accessible
+        model: str = CLAUDE_HAIKU,  # Changed to Haiku - most accessible
+        cache: Optional[LLMCache] = None
     ):
         """
         Initialize Anthropic provider.
@@ -49,8 +80,9 @@ class AnthropicProvider(BaseLLMProvider):
         Args:
             config: Provider configuration with API key
             model: Claude model to use (defaults to Opus for highest quality)
+            cache: Optional response cache for deterministic requests
         """
-        super().__init__(ModelProvider.ANTHROPIC, config)
+        super().__init__(ModelProvider.ANTHROPIC, config, cache=cache)
 
         if not config.api_key:
             raise ProviderException(
@@ -60,7 +92,23 @@ class AnthropicProvider(BaseLLMProvider):
             )
 
         self.model = model
-        self.client = AsyncAnthropic(api_key=config.api_key)
+
+        # Per-call params only add messages/system on top of these
+        self._base_params = {
+            "model": model,
+            "max_tokens": config.max_tokens,
+            "temperature": config.temperature
+        }
+
+        # Same client policy as OpenAI: fail fast on connect/pool waits, and
+        # no SDK retries on top of generate_decision's own (3 x 3 attempts)
+        self.client = AsyncAnthropic(
+            api_key=config.api_key,
+            timeout=httpx.Timeout(config.timeout_seconds, connect=5.0, pool=5.0),
+            max_retries=0,
+            default_headers={"anthropic-beta": PROMPT_CACHING_BETA},
+            http_client=get_shared_http_client()
+        )
 
         logger.info(f"Anthropic provider initialized with model: {model}")
 
@@ -97,14 +145,24 @@ class AnthropicProvider(BaseLLMProvider):
         self,
         prompt: str,
         system_context: Optional[str] = None,
+        on_chunk: Optional[Callable[[str], Awaitable[None]]] = None,
         **kwargs
     ) -> LLMResponse:
         """
         Make API call to Claude with proper error handling.
 
+        The response is streamed, so time to first token is recorded and
+        callers can process text incrementally via on_chunk.
+
+        The system context is sent as a cacheable block, so put static
+        policy/eligibility criteria there and per-case data in the prompt.
+        Repeated policy prefixes are then read from Anthropic's prompt
+        cache instead of being reprocessed on every decision.
+
         Args:
             prompt: The user prompt/question
             system_context: System-level instructions (government policy context)
+            on_chunk: Optional async callback invoked with each streamed text chunk
             **kwargs: Additional parameters (temperature, max_tokens, etc.)
 
         Returns:
@@ -113,60 +171,40 @@ class AnthropicProvider(BaseLLMProvider):
         Raises:
             ProviderException: If API call fails
         """
-        start_time = datetime.now()
+        start_time = perf_counter()
 
         try:
-            # Build the messages array for Claude
-            messages = [{"role": "user", "content": prompt}]
-
-            # Prepare API parameters
-            api_params = {
-                "model": self.model,
-                "max_tokens": kwargs.get("max_tokens", self.config.max_tokens),
-                "temperature": kwargs.get("temperature", self.config.temperature),
-                "messages": messages
-            }
-
-            # Add system context if provided (critical for government decision-making)
-            if system_context:
-                api_params["system"] = system_context
-
-            logger.debug(f"Making Anthropic API call with params: {api_params}")
-
-            # Make the API call
-            response: Message = await self.client.messages.create(**api_params)
-
-            # Extract content from response
-            content = self._extract_content(response)
-
-            # Parse reasoning if present (Claude often provides step-by-step thinking)
-            reasoning = self._extract_reasoning(content)
-
-            # Calculate confidence based on response characteristics
-            confidence = self._calculate_confidence(response, content)
-
-            # Calculate tokens used for cost tracking and auditing
-            tokens_used = response.usage.input_tokens + response.usage.output_tokens
-
-            llm_response = LLMResponse(
-                provider=ModelProvider.ANTHROPIC,
-                model_name=self.model,
-                content=content,
-                reasoning=reasoning,
-                confidence=confidence,
-                timestamp=datetime.now(),
-                tokens_used=tokens_used,
-                metadata={
-                    "stop_reason": response.stop_reason,
-                    "input_tokens": response.usage.input_tokens,
-                    "output_tokens": response.usage.output_tokens,
-                    "model_id": response.model
-                }
-            )
+            api_params = self._build_api_params(prompt, system_context, **kwargs)
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Making Anthropic API call with params: %s",
+                    truncate_for_log(api_params)
+                )
+
+            # Stream the response, buffering chunks in a list (joined once)
+            parts = []
+            ttft_ms = None
+            # timeout_seconds only bounds each read; this bounds the whole
+            # stream so a slowly trickling response can't hold a slot forever
+            async with asyncio.timeout(self.config.timeout_seconds):
+                async with self.client.messages.stream(**api_params) as stream:
+                    async for text in stream.text_stream:
+                        if ttft_ms is None:
+                            ttft_ms = (perf_counter() - start_time) * 1000
+                        parts.append(text)
+                        if on_chunk:
+                            await on_chunk(text)
+
+                    # Final message carries usage and stop_reason
+                    response: Message = await stream.get_final_message()
+
+            llm_response = self._build_llm_response(response, "".join(parts))
+            llm_response.ttft_ms = ttft_ms
 
             logger.info(
-                f"Claude API call successful - Tokens: {tokens_used}, "
-                f"Confidence: {confidence:.2f}"
+                "Claude API call successful - Tokens: %s, Confidence: %.2f",
+                llm_response.tokens_used, llm_response.confidence
             )
 
             return llm_response
@@ -176,6 +214,23 @@ class AnthropicProvider(BaseLLMProvider):
             raise ProviderException(
                 f"Rate limit exceeded: {str(e)}",
                 ModelProvider.ANTHROPIC,
+                recoverable=True,
+                retry_after=parse_retry_after(e.response.headers)
+            )
+
+        except APITimeoutError as e:
+            logger.warning(f"Anthropic request timeout: {str(e)}")
+            raise ProviderException(
+                f"Request timeout after {self.config.timeout_seconds}s",
+                ModelProvider.ANTHROPIC,
+                recoverable=True
+            )
+
+        except TimeoutError:
+            logger.warning("Anthropic response not completed within %ss", self.config.timeout_seconds)
+            raise ProviderException(
+                f"Response not completed within {self.config.timeout_seconds}s",
+                ModelProvider.ANTHROPIC,
                 recoverable=True
             )
 
@@ -187,6 +242,18 @@ class AnthropicProvider(BaseLLMProvider):
                 recoverable=True
             )
 
+        except APIStatusError as e:
+            # 5xx (InternalServerError) and 529 overloaded are transient; the
+            # client has max_retries=0, so the base retry loop must see them
+            recoverable = e.status_code >= 500
+            logger.error(f"Anthropic API error ({e.status_code}): {str(e)}")
+            raise ProviderException(
+                f"API error: {str(e)}",
+                ModelProvider.ANTHROPIC,
+                recoverable=recoverable,
+                retry_after=parse_retry_after(e.response.headers) if recoverable else None
+            )
+
         except APIError as e:
             logger.error(f"Anthropic API error: {str(e)}")
             raise ProviderException(
@@ -203,6 +270,171 @@ class AnthropicProvider(BaseLLMProvider):
                 recoverable=False
             )
 
+    async def generate_decision_batch(
+        self,
+        requests: List[BatchRequest],
+        max_concurrency: int = 5,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+        poll_interval_seconds: float = 10.0
+    ) -> List[LLMResponse]:
+        """
+        Generate decisions for many prompts via the Message Batches API.
+
+        Batches are billed at half price and don't count against the
+        per-request rate limit, at the cost of asynchronous completion
+        (minutes to hours). Falls back to bounded concurrent calls if the
+        installed SDK has no batch support.
+
+        Args:
+            requests: Prompts to evaluate
+            max_concurrency: Concurrency limit for the fallback path
+            on_progress: Optional callback called with (completed, total)
+            poll_interval_seconds: How often to check batch status
+
+        Returns:
+            One LLMResponse per request, in the same order
+        """
+        batches = getattr(self.client.messages, "batches", None)
+        if batches is None:
+            logger.info("Message Batches API not available - using concurrent calls")
+            return await super().generate_decision_batch(
+                requests, max_concurrency, on_progress
+            )
+
+        try:
+            batch = await batches.create(
+                requests=[
+                    {
+                        "custom_id": r.custom_id,
+                        "params": self._build_api_params(r.prompt, r.system_context)
+                    }
+                    for r in requests
+                ]
+            )
+            logger.info(f"Submitted Anthropic batch {batch.id} ({len(requests)} requests)")
+
+            while batch.processing_status != "ended":
+                await asyncio.sleep(poll_interval_seconds)
+                batch = await batches.retrieve(batch.id)
+                if on_progress:
+                    counts = batch.request_counts
+                    on_progress(len(requests) - counts.processing, len(requests))
+
+            # Results arrive in arbitrary order - match them back by custom_id
+            results: Dict[str, LLMResponse] = {}
+            async for entry in await batches.results(batch.id):
+                if entry.result.type == "succeeded":
+                    message = entry.result.message
+                    results[entry.custom_id] = self._build_llm_response(
+                        message, self._extract_content(message)
+                    )
+
+        except APIError as e:
+            logger.error(f"Anthropic batch failed: {str(e)}")
+            raise ProviderException(
+                f"Batch error: {str(e)}",
+                ModelProvider.ANTHROPIC,
+                recoverable=False
+            )
+
+        # Errored, canceled or expired entries get an error response
+        return [
+            results.get(r.custom_id) or LLMResponse(
+                provider=ModelProvider.ANTHROPIC,
+                model_name=self.model,
+                content="",
+                reasoning=None,
+                confidence=None,
+                timestamp=datetime.now(timezone.utc),
+                error=f"Batch request {r.custom_id} did not succeed"
+            )
+            for r in requests
+        ]
+
+    def _build_api_params(
+        self,
+        prompt: str,
+        system_context: Optional[str] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Build Messages API parameters for a single prompt.
+
+        Args:
+            prompt: The user prompt/question
+            system_context: System-level instructions (government policy context)
+            **kwargs: Additional parameters (temperature, max_tokens, etc.)
+
+        Returns:
+            Keyword arguments for messages.create/stream (or a batch entry's params)
+        """
+        # Start from the precomputed defaults and add the messages array
+        api_params = self._base_params | {
+            "messages": [{"role": "user", "content": prompt}]
+        }
+
+        # Override defaults only when the caller asked to
+        if "max_tokens" in kwargs:
+            api_params["max_tokens"] = kwargs["max_tokens"]
+        if "temperature" in kwargs:
+            api_params["temperature"] = kwargs["temperature"]
+
+        # Add system context if provided (critical for government decision-making)
+        # Marked ephemeral so the policy prefix is cached across requests
+        if system_context:
+            api_params["system"] = [
+                {
+                    "type": "text",
+                    "text": system_context,
+                    "cache_control": {"type": "ephemeral"}
+                }
+            ]
+
+        return api_params
+
+    def _build_llm_response(self, response: Message, content: str) -> LLMResponse:
+        """
+        Convert a completed Claude message into an LLMResponse.
+
+        Args:
+            response: The final Claude message (usage, stop_reason, model)
+            content: The message text
+
+        Returns:
+            LLMResponse with reasoning, confidence and token accounting
+        """
+        # Parse reasoning if present (Claude often provides step-by-step thinking)
+        reasoning = self._extract_reasoning(content)
+
+        # Calculate confidence based on response characteristics
+        confidence = self._calculate_confidence(response, content)
+
+        # Calculate tokens used for cost tracking and auditing
+        tokens_used = response.usage.input_tokens + response.usage.output_tokens
+
+        return LLMResponse(
+            provider=ModelProvider.ANTHROPIC,
+            model_name=self.model,
+            content=content,
+            reasoning=reasoning,
+            confidence=confidence,
+            timestamp=datetime.now(timezone.utc),
+            tokens_used=tokens_used,
+            metadata={
+                "stop_reason": response.stop_reason,
+                "input_tokens": response.usage.input_tokens,
+                "output_tokens": response.usage.output_tokens,
+                # Prompt cache usage (for cost tracking)
+                "cache_creation_input_tokens": getattr(
+                    response.usage, "cache_creation_input_tokens", None
+                ),
+                "cache_read_input_tokens": getattr(
+                    response.usage, "cache_read_input_tokens", None
+                ),
+                "model_id": response.model
+            }
+        )
+
     def _extract_content(self, response: Message) -> str:
         """
         Extract text content from Claude response.
@@ -216,13 +448,13 @@ class AnthropicProvider(BaseLLMProvider):
         Returns:
             Combined text content
         """
-        content_parts = []
+        blocks = response.content
 
-        for block in response.content:
-            if hasattr(block, 'text'):
-                content_parts.append(block.text)
+        # Common case: a single text block needs no join
+        if len(blocks) == 1 and hasattr(blocks[0], 'text'):
+            return blocks[0].text
 
-        return "\n".join(content_parts)
+        return "\n".join(block.text for block in blocks if hasattr(block, 'text'))
 
     def _extract_reasoning(self, content: str) -> Optional[str]:
         """
@@ -238,27 +470,18 @@ class AnthropicProvider(BaseLLMProvider):
             Extracted reasoning or None if not found
         """
         # Look for common reasoning patterns Claude uses
-        reasoning_markers = [
-            "Let me think through this",
-            "Here's my reasoning:",
-            "Step-by-step analysis:",
-            "My analysis:",
-            "Reasoning:"
-        ]
-
-        for marker in reasoning_markers:
-            if marker.lower() in content.lower():
-                # Extract the reasoning section
-                parts = content.split(marker, 1)
-                if len(parts) > 1:
-                    # Get text after marker until decision/conclusion
-                    reasoning_text = parts[1].split("\n\n")[0]
-                    return reasoning_text.strip()
+        match = self._REASONING_RE.search(content)
+        if match:
+            # Get text after marker until decision/conclusion (sliced once,
+            # without splitting the rest of the response)
+            start = match.end()
+            end = content.find("\n\n", start)
+            return content[start:end if end != -1 else None].strip()
 
         # If no explicit reasoning section, return first paragraph as implicit reasoning
-        paragraphs = content.split("\n\n")
-        if len(paragraphs) > 1:
-            return paragraphs[0].strip()
+        end = content.find("\n\n")
+        if end != -1:
+            return content[:end].strip()
 
         return None
 
@@ -285,24 +508,14 @@ class AnthropicProvider(BaseLLMProvider):
         elif response.stop_reason == "max_tokens":
             confidence -= 0.1  # Incomplete response reduces confidence
 
-        # Analyze language for certainty markers
-        certainty_markers = [
-            "clearly", "definitely", "certainly", "without doubt",
-            "conclusively", "unambiguous"
-        ]
-        uncertainty_markers = [
-            "might", "possibly", "perhaps", "unclear", "uncertain",
-            "difficult to determine", "depends on"
-        ]
-
-        content_lower = content.lower()
+        # Analyze language for certainty markers (each distinct marker counts once)
 
         # Boost confidence for certainty markers
-        certainty_count = sum(1 for marker in certainty_markers if marker in content_lower)
+        certainty_count = count_distinct_markers(CERTAINTY_MARKERS_RE, content)
         confidence += min(0.2, certainty_count * 0.05)
 
         # Reduce confidence for uncertainty markers
-        uncertainty_count = sum(1 for marker in uncertainty_markers if marker in content_lower)
+        uncertainty_count = count_distinct_markers(UNCERTAINTY_MARKERS_RE, content)
         confidence -= min(0.3, uncertainty_count * 0.1)
 
         # Ensure confidence stays in valid range
@@ -328,41 +541,12 @@ class AnthropicProvider(BaseLLMProvider):
         Returns:
             LLMResponse with structured decision and per-criterion evaluation
         """
-        # Build enhanced prompt with structured output requirements
-        structured_prompt = f"""
-{prompt}
-
-Please evaluate this case against the following criteria and provide:
-1. A decision (APPROVE/DENY/NEEDS_REVIEW)
-2. Reasoning for each criterion
-3. Overall confidence in the decision
-
-Criteria to evaluate:
-{self._format_criteria(decision_criteria)}
-
-Provide your response in the following structure:
-- Decision: [APPROVE/DENY/NEEDS_REVIEW]
-- Reasoning: [Step-by-step analysis]
-- Criterion Evaluations: [For each criterion]
-- Confidence: [High/Medium/Low]
-"""
+        # Criteria and output instructions are the same for every case in a
+        # program, so they go in the (prompt-cached) system context ahead of
+        # nothing but the per-case details in the user prompt
+        structured_system = f"{system_context}\n\n{self._criteria_instructions(decision_criteria)}"
 
         return await self.generate_decision(
-            prompt=structured_prompt,
-            system_context=system_context
+            prompt=prompt,
+            system_context=structured_system
         )
-
-    def _format_criteria(self, criteria: Dict[str, Any]) -> str:
-        """
-        Format decision criteria for prompt inclusion.
-
-        Args:
-            criteria: Dictionary of evaluation criteria
-
-        Returns:
-            Formatted criteria string
-        """
-        formatted = []
-        for key, value in criteria.items():
-            formatted.append(f"- {key}: {value}")
-        return "\n".join(formatted)
@@ -7,13 +7,26 @@ government compliance requirements for audit trails and error handling.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional
-from datetime import datetime
+from typing import TYPE_CHECKING, Callable, Dict, Any, List, Optional, Tuple
+from datetime import datetime, timezone
+from time import monotonic, perf_counter
 from enum import Enum
 import asyncio
-from dataclasses import dataclass, field
+import hashlib
+import random
+import re
+from dataclasses import dataclass, field, replace
 import logging
 
+import httpx
+import orjson
+from aiolimiter import AsyncLimiter
+from cachetools import LRUCache
+
+if TYPE_CHECKING:
+    from .cache import LLMCache
+    from .semantic_cache import SemanticCache
+
 # Configure logging for compliance and debugging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -33,7 +46,7 @@ class ProviderStatus(str, Enum):
     UNAVAILABLE = "unavailable"
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMResponse:
     """
     Structured response from an LLM provider.
@@ -50,6 +63,7 @@ class LLMResponse:
     metadata: Dict[str, Any] = field(default_factory=dict)
     tokens_used: Optional[int] = None
     latency_ms: Optional[float] = None
+    ttft_ms: Optional[float] = None  # Time to first streamed token
     error: Optional[str] = None
 
     def to_audit_dict(self) -> Dict[str, Any]:
@@ -72,14 +86,50 @@ class LLMResponse:
             "error": self.error
         }
 
+    def to_audit_json(self) -> bytes:
+        """
+        Serialize the audit record to JSON bytes for audit log writers.
+
+        Uses orjson (C) rather than the stdlib json encoder, since an
+        audit record is written for every provider response.
+        """
+        return orjson.dumps(self.to_audit_dict())
+
+
+@dataclass(slots=True)
+class BatchRequest:
+    """A single prompt submitted as part of a batch of decisions."""
+    custom_id: str  # Caller-chosen ID used to match results (e.g. case ID)
+    prompt: str
+    system_context: Optional[str] = None
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ProviderConfig:
-    """Configuration for LLM provider initialization."""
+    """Configuration for LLM provider initialization (immutable once built)."""
     api_key: Optional[str] = None
     base_url: Optional[str] = None
     max_retries: int = 3
     timeout_seconds: int = 60
+
+    # Retry backoff: base_delay * 2**attempt, scaled by up to (1 + jitter), capped
+    base_delay: float = 1.0
+    max_backoff_seconds: float = 30.0
+    jitter: float = 0.5
+
+    # Concurrency/rate limits per provider instance (0 = no rate limit)
+    max_concurrency: int = 32
+    rate_limit_rpm: int = 0
+
+    # Connection pool for providers that manage their own HTTP session (Ollama).
+    # aiohttp has no separate keep-alive cap: idle connections are kept
+    # within these limits for keepalive_expiry seconds
+    max_connections: int = 50
+    max_connections_per_host: int = 0  # Hard per-host cap (0 = only max_connections)
+    keepalive_expiry: float = 30.0
+
+    # How long a health-check verdict is reused (0 = always check)
+    health_ttl_seconds: float = 5.0
     temperature: float = 0.7
     max_tokens: int = 2000
 
@@ -89,6 +139,118 @@ class ProviderConfig:
     pii_detection: bool = True
 
 
+# Language markers used by every provider's confidence heuristic. Matched
+# case-insensitively on the raw content, so no lowercased copy is needed,
+# and as whole words/phrases so "nuclear" or "uncertainly" don't count.
+CERTAINTY_MARKERS_RE = re.compile(
+    r"\b(?:clearly|definitely|certainly|without doubt|conclusively|unambiguous)\b",
+    re.IGNORECASE
+)
+UNCERTAINTY_MARKERS_RE = re.compile(
+    r"\b(?:might|possibly|perhaps|unclear|uncertain|difficult to determine|depends on)\b",
+    re.IGNORECASE
+)
+
+
+def parse_retry_after(headers: Any) -> Optional[float]:
+    """
+    Read how long a rate-limited response asked us to wait.
+
+    Args:
+        headers: Response headers (httpx.Headers or any mapping)
+
+    Returns:
+        Seconds to wait, or None if the headers don't say (HTTP-date
+        values are ignored)
+    """
+    if not headers:
+        return None
+
+    try:
+        retry_after_ms = headers.get("retry-after-ms")
+        if retry_after_ms is not None:
+            return float(retry_after_ms) / 1000
+
+        retry_after = headers.get("retry-after")
+        if retry_after is not None:
+            return float(retry_after)
+    except ValueError:
+        pass
+
+    return None
+
+
+def truncate_for_log(value: Any, max_chars: int = 200) -> Any:
+    """
+    Copy request parameters with long strings shortened for debug logs.
+
+    Policy documents and case files can be many KB; logging them in full
+    on every call floods the logs and costs time formatting them.
+
+    Args:
+        value: Parameters (dicts/lists/strings nested arbitrarily)
+        max_chars: Longest string kept intact
+
+    Returns:
+        The same structure with long strings truncated
+    """
+    if isinstance(value, str):
+        if len(value) <= max_chars:
+            return value
+        return f"{value[:max_chars]}... [{len(value)} chars]"
+    if isinstance(value, dict):
+        return {key: truncate_for_log(item, max_chars) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [truncate_for_log(item, max_chars) for item in value]
+    return value
+
+
+def count_distinct_markers(pattern: re.Pattern, content: str) -> int:
+    """
+    Count how many distinct markers from a compiled alternation occur in content.
+
+    Args:
+        pattern: Case-insensitive alternation of markers
+        content: Text to scan
+
+    Returns:
+        Number of different markers found (repeats count once)
+    """
+    return len({match.lower() for match in pattern.findall(content)})
+
+
+# Health status per 0.1-wide error-rate bucket: <20% healthy, 20-50%
+# degraded, 50%+ unavailable (index 10 covers an error rate of exactly 1.0)
+_STATUS_TABLE = (
+    (ProviderStatus.HEALTHY,) * 2
+    + (ProviderStatus.DEGRADED,) * 3
+    + (ProviderStatus.UNAVAILABLE,) * 6
+)
+
+# One connection pool shared by every SDK-based provider instance, so TLS
+# handshakes and keep-alive connections are reused across providers
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_shared_http_client() -> httpx.AsyncClient:
+    """
+    Get the process-wide pooled HTTP client, creating it on first use.
+
+    Returns:
+        httpx.AsyncClient with bounded connection and keep-alive limits
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=64,
+                max_keepalive_connections=32,
+                keepalive_expiry=60
+            )
+        )
+    return _http_client
+
+
 class BaseLLMProvider(ABC):
     """
     Abstract base class for all LLM providers.
@@ -97,12 +259,25 @@ class BaseLLMProvider(ABC):
     error handling, retry logic, and audit logging across all
     AI model integrations. Subclasses must implement model-specific
     communication while inheriting compliance safeguards.
+
+    Providers cache prompt prefixes server-side (Anthropic cache_control,
+    OpenAI prompt_cache_key, Ollama's loaded context), so callers should
+    pass the static policy text as system_context and keep it byte-stable
+    across cases - no timestamps or case data in it - with case-specific
+    details in the prompt.
     """
 
+    # Generation options callers may override per request. Other kwargs
+    # (e.g. orchestrator bookkeeping) are never forwarded to the API,
+    # where an unknown parameter would fail the whole request.
+    _REQUEST_OPTIONS = frozenset({"max_tokens", "temperature"})
+
     def __init__(
         self,
         provider: ModelProvider,
-        config: ProviderConfig
+        config: ProviderConfig,
+        cache: Optional["LLMCache"] = None,
+        semantic_cache: Optional["SemanticCache"] = None
     ):
         """
         Initialize the provider with configuration.
@@ -110,12 +285,30 @@ class BaseLLMProvider(ABC):
         Args:
             provider: The type of provider (Anthropic, OpenAI, etc.)
             config: Configuration object with API keys and settings
+            cache: Optional response cache for deterministic (temperature 0) requests
+            semantic_cache: Optional similarity-based cache for low-temperature
+                requests, consulted after an exact-match miss
         """
         self.provider = provider
         self.config = config
+        self.cache = cache
+        self.semantic_cache = semantic_cache
         self._status = ProviderStatus.HEALTHY
         self._request_count = 0
         self._error_count = 0
+        self._error_ewma = 0.0  # Time-decayed error rate driving health status
+        self._health_cache: Optional[Tuple[float, Any]] = None  # (expires_at, verdict)
+        self._inflight: Dict[str, "asyncio.Future[LLMResponse]"] = {}  # cache_key -> leading call
+
+        # Rendered structured-decision instructions, keyed by criteria digest
+        self._criteria_cache: LRUCache = LRUCache(maxsize=128)
+
+        # Bound in-flight requests (and open connections) per provider, and
+        # optionally smooth them to a requests-per-minute token bucket
+        self._concurrency = asyncio.Semaphore(config.max_concurrency)
+        self._rate_limiter = (
+            AsyncLimiter(config.rate_limit_rpm, 60) if config.rate_limit_rpm else None
+        )
 
         logger.info(f"Initializing {provider.value} provider with config: {config}")
 
@@ -130,7 +323,9 @@ class BaseLLMProvider(ABC):
         Make the actual API call to the LLM provider.
 
         This method must be implemented by each provider subclass
-        to handle provider-specific API communication.
+        to handle provider-specific API communication. Implementations
+        must enforce config.timeout_seconds themselves (ideally in the
+        HTTP client) - generate_decision does not add its own timeout.
 
         Args:
             prompt: The user prompt/question
@@ -138,7 +333,10 @@ class BaseLLMProvider(ABC):
             **kwargs: Provider-specific additional parameters
 
         Returns:
-            LLMResponse object with structured response data
+            LLMResponse object with structured response data. Transient
+            failures may instead be returned as an LLMResponse with `error`
+            set and metadata["recoverable"] = True; generate_decision
+            retries those like a recoverable ProviderException.
 
         Raises:
             ProviderException: If the API call fails
@@ -181,7 +379,7 @@ class BaseLLMProvider(ABC):
         Raises:
             ProviderException: After all retries exhausted
         """
-        start_time = datetime.now()
+        start_time = perf_counter()
         decision_context = decision_context or {}
 
         # Log the request for compliance
@@ -191,60 +389,222 @@ class BaseLLMProvider(ABC):
                 f"Context: {decision_context}"
             )
 
+        # Forwarded generation options beyond temperature/max_tokens (e.g.
+        # top_p, stop, response_format) change the output, so they are part
+        # of the cache key
+        options = {
+            name: kwargs[name]
+            for name in sorted(self._REQUEST_OPTIONS.intersection(kwargs))
+            if name not in ("temperature", "max_tokens")
+        }
+
+        # Serve deterministic requests from the response cache when possible
+        cache_key = None
+        temperature = kwargs.get("temperature", self.config.temperature)
+        if self.cache and self.cache.is_cacheable(temperature):
+            messages = [
+                {"role": "system", "content": system_context},
+                {"role": "user", "content": prompt}
+            ] if system_context else [{"role": "user", "content": prompt}]
+            cache_key = self.cache.cache_key(
+                self.provider.value,
+                getattr(self, "model", "unknown"),
+                messages,
+                temperature,
+                kwargs.get("max_tokens", self.config.max_tokens),
+                options
+            )
+
+            cached = await self.cache.get(cache_key)
+            if cached is not None:
+                cached.latency_ms = (perf_counter() - start_time) * 1000
+                logger.info(f"Cache hit for {self.provider.value} - skipping API call")
+                return cached
+
+        # Then fall back to a paraphrase match, if a semantic cache is set up
+        # (its scope doesn't cover extra options, so those requests skip it)
+        semantic_scope = None
+        if (
+            self.semantic_cache
+            and not options
+            and temperature <= self.semantic_cache.MAX_TEMPERATURE
+        ):
+            semantic_scope = self.semantic_cache.scope(
+                self.provider.value,
+                getattr(self, "model", "unknown"),
+                system_context,
+                temperature
+            )
+            similar = await self.semantic_cache.get(semantic_scope, prompt)
+            if similar is not None:
+                similar.latency_ms = (perf_counter() - start_time) * 1000
+                logger.info(f"Semantic cache hit for {self.provider.value} - skipping API call")
+                return similar
+
+        # Identical deterministic requests already in flight share one call
+        # instead of each running its own (cache_key is only set for those)
+        if not cache_key:
+            response = await self._generate_with_retries(
+                prompt, system_context, start_time, cache_key, **kwargs
+            )
+        else:
+            while (inflight := self._inflight.get(cache_key)) is not None:
+                logger.info(f"Joining in-flight {self.provider.value} request - skipping API call")
+                try:
+                    result = await asyncio.shield(inflight)
+                except asyncio.CancelledError:
+                    # Only the leader was cancelled - make (or join) a new call
+                    if inflight.cancelled() and not asyncio.current_task().cancelling():
+                        continue
+                    raise
+                return replace(
+                    result,
+                    latency_ms=(perf_counter() - start_time) * 1000,
+                    metadata={**result.metadata, "coalesced": True}
+                )
+
+            future = asyncio.get_running_loop().create_future()
+            self._inflight[cache_key] = future
+            try:
+                response = await self._generate_with_retries(
+                    prompt, system_context, start_time, cache_key, **kwargs
+                )
+            except Exception as e:
+                # Waiters see the same failure; mark it retrieved so a future
+                # nobody waited on doesn't log "exception was never retrieved"
+                future.set_exception(e)
+                future.exception()
+                raise
+            else:
+                future.set_result(response)
+            finally:
+                # Cancelled leader: waiters retry on their own instead
+                if not future.done():
+                    future.cancel()
+                del self._inflight[cache_key]
+
+        if semantic_scope is not None:
+            await self.semantic_cache.set(semantic_scope, prompt, response)
+
+        return response
+
+    async def _generate_with_retries(
+        self,
+        prompt: str,
+        system_context: Optional[str],
+        start_time: float,
+        cache_key: Optional[str],
+        **kwargs
+    ) -> LLMResponse:
+        """
+        Call the provider with retries and exponential backoff.
+
+        Args:
+            prompt: The decision prompt
+            system_context: Government policy context and requirements
+            start_time: perf_counter() value when the request started
+            cache_key: Response cache key, or None if the request isn't cacheable
+            **kwargs: Provider-specific parameters
+
+        Returns:
+            The successful LLMResponse, or an error response once retries
+            are exhausted or the failure isn't recoverable
+        """
         # Implement exponential backoff retry logic
         last_exception = None
+        attempts_made = 0
         for attempt in range(self.config.max_retries):
+            attempts_made += 1
+            retry_after = None
             try:
                 self._request_count += 1
 
-                # Make the actual API call
-                response = await asyncio.wait_for(
-                    self._make_api_call(prompt, system_context, **kwargs),
-                    timeout=self.config.timeout_seconds
-                )
-
-                # Calculate latency for monitoring
-                latency_ms = (datetime.now() - start_time).total_seconds() * 1000
-                response.latency_ms = latency_ms
-
-                # Log successful response
-                logger.info(
-                    f"Successful response from {self.provider.value} - "
-                    f"Latency: {latency_ms}ms, Tokens: {response.tokens_used}"
-                )
-
-                return response
+                # Make the actual API call (queueing for a slot doesn't count
+                # toward the timeout; slots are released during backoff).
+                # The timeout is enforced by the provider's HTTP client.
+                async with self._concurrency:
+                    if self._rate_limiter:
+                        await self._rate_limiter.acquire()
+                    response = await self._make_api_call(
+                        prompt, system_context, **kwargs
+                    )
 
             except asyncio.TimeoutError as e:
                 last_exception = e
                 self._error_count += 1
+                self._record_outcome(is_error=True)
                 logger.warning(
                     f"Timeout on {self.provider.value} (attempt {attempt + 1}/{self.config.max_retries})"
                 )
 
             except Exception as e:
                 last_exception = e
+                retry_after = getattr(e, "retry_after", None)
                 self._error_count += 1
+                self._record_outcome(is_error=True)
                 logger.error(
                     f"Error on {self.provider.value} (attempt {attempt + 1}/{self.config.max_retries}): {str(e)}"
                 )
 
-            # Exponential backoff before retry
+                # Retrying can't fix bad credentials, invalid requests, etc.,
+                # nor unexpected errors (bugs) that aren't provider failures
+                if not isinstance(e, ProviderException) or not e.recoverable:
+                    break
+
+            else:
+                if response.error is None:
+                    # Calculate latency for monitoring
+                    latency_ms = (perf_counter() - start_time) * 1000
+                    response.latency_ms = latency_ms
+
+                    # Log successful response (lazy args - no formatting if INFO is off)
+                    logger.info(
+                        "Successful response from %s - Latency: %.1fms, Tokens: %s",
+                        self.provider.value, latency_ms, response.tokens_used
+                    )
+                    self._record_outcome(is_error=False)
+
+                    if cache_key:
+                        await self.cache.set(cache_key, response)
+
+                    return response
+
+                # Provider reported the failure as an error result instead of
+                # raising (cheaper for frequent transient errors)
+                last_exception = response.error
+                self._error_count += 1
+                self._record_outcome(is_error=True)
+                logger.error(
+                    f"Error on {self.provider.value} (attempt {attempt + 1}/{self.config.max_retries}): {response.error}"
+                )
+
+                if not response.metadata.get("recoverable"):
+                    break
+
+            # Exponential backoff with jitter before retry, so providers that
+            # hit a rate limit together don't retry in lockstep. A provider's
+            # Retry-After is honoured as a floor (still capped).
             if attempt < self.config.max_retries - 1:
-                backoff_seconds = 2 ** attempt
-                logger.info(f"Retrying in {backoff_seconds} seconds...")
+                backoff_seconds = min(
+                    self.config.max_backoff_seconds,
+                    max(
+                        retry_after or 0.0,
+                        self.config.base_delay * (2 ** attempt)
+                        * (1 + random.random() * self.config.jitter)
+                    )
+                )
+                logger.info(f"Retrying in {backoff_seconds:.2f} seconds...")
                 await asyncio.sleep(backoff_seconds)
 
-        # All retries exhausted - update status and raise
-        self._update_status()
+        # All retries exhausted - return an error response
         error_response = LLMResponse(
             provider=self.provider,
             model_name="unknown",
             content="",
             reasoning=None,
             confidence=None,
-            timestamp=datetime.now(),
-            error=f"Failed after {self.config.max_retries} attempts: {str(last_exception)}"
+            timestamp=datetime.now(timezone.utc),
+            error=f"Failed after {attempts_made} attempts: {str(last_exception)}"
         )
 
         logger.error(
@@ -254,30 +614,209 @@ class BaseLLMProvider(ABC):
 
         return error_response
 
+    async def generate_decision_batch(
+        self,
+        requests: List[BatchRequest],
+        max_concurrency: int = 5,
+        on_progress: Optional[Callable[[int, int], None]] = None
+    ) -> List[LLMResponse]:
+        """
+        Generate decisions for many prompts at once.
+
+        The default runs generate_decision concurrently, bounded by a
+        semaphore so a large batch doesn't trip provider rate limits.
+        Providers with a native batch API override this.
+
+        Args:
+            requests: Prompts to evaluate
+            max_concurrency: Maximum number of in-flight API calls
+            on_progress: Optional callback called with (completed, total)
+                as each request finishes
+
+        Returns:
+            One LLMResponse per request, in the same order. A request that
+            raised is returned as an error response rather than failing
+            the whole batch.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        total = len(requests)
+        completed = 0
+
+        async def run(request: BatchRequest) -> LLMResponse:
+            nonlocal completed
+            try:
+                async with semaphore:
+                    return await self.generate_decision(
+                        prompt=request.prompt,
+                        system_context=request.system_context,
+                        decision_context={"custom_id": request.custom_id}
+                    )
+            finally:
+                completed += 1
+                if on_progress:
+                    on_progress(completed, total)
+
+        results = await asyncio.gather(
+            *(run(r) for r in requests),
+            return_exceptions=True
+        )
+
+        return [
+            result if isinstance(result, LLMResponse) else LLMResponse(
+                provider=self.provider,
+                model_name=getattr(self, "model", "unknown"),
+                content="",
+                reasoning=None,
+                confidence=None,
+                timestamp=datetime.now(timezone.utc),
+                error=f"Batch request {request.custom_id} failed: {str(result)}"
+            )
+            for request, result in zip(requests, results)
+        ]
+
+    def _criteria_instructions(self, criteria: Dict[str, Any]) -> str:
+        """
+        Render the structured-evaluation instructions for a set of criteria.
+
+        Rendered once per distinct criteria set - eligibility rules rarely
+        change between applicants.
+
+        Args:
+            criteria: Dictionary of evaluation criteria
+
+        Returns:
+            Instructions block listing the criteria and expected output structure
+        """
+        # Keyed in insertion order - the order the criteria are rendered in
+        key = hashlib.blake2b(orjson.dumps(criteria, default=str)).hexdigest()
+
+        instructions = self._criteria_cache.get(key)
+        if instructions is None:
+            instructions = f"""Please evaluate each case against the following criteria and provide:
+1. A decision (APPROVE/DENY/NEEDS_REVIEW)
+2. Reasoning for each criterion
+3. Overall confidence in the decision
+
+Criteria to evaluate:
+{self._format_criteria(criteria)}
+
+Provide your response in the following structure:
+- Decision: [APPROVE/DENY/NEEDS_REVIEW]
+- Reasoning: [Step-by-step analysis]
+- Criterion Evaluations: [For each criterion]
+- Confidence: [High/Medium/Low]"""
+            self._criteria_cache[key] = instructions
+
+        return instructions
+
+    def _format_criteria(self, criteria: Dict[str, Any]) -> str:
+        """
+        Format decision criteria for prompt inclusion.
+
+        Args:
+            criteria: Dictionary of evaluation criteria
+
+        Returns:
+            Formatted criteria string
+        """
+        formatted = []
+        for key, value in criteria.items():
+            formatted.append(f"- {key}: {value}")
+        return "\n".join(formatted)
+
+    def _record_outcome(self, is_error: bool) -> None:
+        """
+        Fold one API attempt into the error-rate EWMA and refresh status.
+
+        Args:
+            is_error: Whether the attempt failed
+        """
+        self._error_ewma = 0.9 * self._error_ewma + 0.1 * is_error
+        self._update_status()
+
     def _update_status(self) -> None:
         """
-        Update provider health status based on error rate.
+        Update provider health status based on recent error rate.
 
+        Uses an exponentially weighted error rate, so a provider recovers
+        once recent calls succeed instead of carrying its lifetime history.
         This enables the orchestrator to route around unhealthy providers
         and maintain system reliability.
         """
-        if self._request_count == 0:
-            self._status = ProviderStatus.HEALTHY
-            return
+        error_rate = self._error_ewma
+        status = _STATUS_TABLE[min(10, int(error_rate * 10))]
 
-        error_rate = self._error_count / self._request_count
+        if status != self._status:
+            self._status = status
+            logger.info(
+                "%s status: %s (recent error rate: %.2f%%)",
+                self.provider.value, status.value, error_rate * 100
+            )
 
-        if error_rate > 0.5:
-            self._status = ProviderStatus.UNAVAILABLE
-        elif error_rate > 0.2:
-            self._status = ProviderStatus.DEGRADED
-        else:
-            self._status = ProviderStatus.HEALTHY
+    def _cached_health(self) -> Optional[Any]:
+        """
+        Get the last health-check verdict if it hasn't expired yet.
 
-        logger.info(
-            f"{self.provider.value} status: {self._status.value} "
-            f"(error rate: {error_rate:.2%})"
-        )
+        Returns:
+            The cached verdict, or None if there is none or it expired
+        """
+        if self._health_cache is None:
+            return None
+
+        expires_at, verdict = self._health_cache
+        if monotonic() >= expires_at:
+            return None
+        return verdict
+
+    def _store_health(self, verdict: Any) -> Any:
+        """
+        Cache a health-check verdict for config.health_ttl_seconds.
+
+        The TTL gets +/-0.5s of jitter so instances started together don't
+        re-check in lockstep.
+
+        Args:
+            verdict: Result of the real health check
+
+        Returns:
+            The verdict, so checks can `return self._store_health(...)`
+        """
+        if self.config.health_ttl_seconds > 0:
+            ttl = self.config.health_ttl_seconds + random.uniform(-0.5, 0.5)
+            self._health_cache = (monotonic() + ttl, verdict)
+        return verdict
+
+    async def prewarm(self) -> None:
+        """
+        Warm up connections/models before the first real request.
+
+        No-op by default; providers with a costly cold start (e.g. a local
+        model that must be loaded into memory) override this. Must not raise.
+        """
+        pass
+
+    async def close(self) -> None:
+        """
+        Release per-provider resources (sessions, connections).
+
+        No-op by default; providers that hold their own connections
+        override this.
+        """
+        pass
+
+    async def __aenter__(self) -> "BaseLLMProvider":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    @classmethod
+    async def aclose(cls) -> None:
+        """Close the shared HTTP connection pool (call on application shutdown)."""
+        global _http_client
+        if _http_client is not None and not _http_client.is_closed:
+            await _http_client.aclose()
+        _http_client = None
 
     def get_status(self) -> ProviderStatus:
         """Get current health status of the provider."""
@@ -295,15 +834,23 @@ class BaseLLMProvider(ABC):
             else 0.0
         )
 
-        return {
+        metrics = {
             "provider": self.provider.value,
             "status": self._status.value,
             "total_requests": self._request_count,
             "total_errors": self._error_count,
             "error_rate": error_rate,
-            "health_score": max(0.0, 1.0 - error_rate)
+            "recent_error_rate": self._error_ewma,
+            "health_score": max(0.0, 1.0 - self._error_ewma)
         }
 
+        if self.cache:
+            metrics["cache"] = self.cache.get_stats()
+        if self.semantic_cache:
+            metrics["semantic_cache"] = self.semantic_cache.get_stats()
+
+        return metrics
+
 
 class ProviderException(Exception):
     """Base exception for provider errors."""
@@ -312,7 +859,8 @@ class ProviderException(Exception):
         self,
         message: str,
         provider: ModelProvider,
-        recoverable: bool = True
+        recoverable: bool = True,
+        retry_after: Optional[float] = None
     ):
         """
         Initialize provider exception.
@@ -321,8 +869,10 @@ class ProviderException(Exception):
             message: Error description
             provider: Which provider raised the error
             recoverable: Whether retry might succeed
+            retry_after: Seconds the provider asked us to wait (Retry-After)
         """
         self.message = message
         self.provider = provider
         self.recoverable = recoverable
+        self.retry_after = retry_after
         super().__init__(self.message)
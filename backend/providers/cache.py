@@ -0,0 +1,252 @@
+"""
+LLM response cache for TrustChain providers.
+
+Deterministic requests (temperature 0) with the same provider, model,
+system context and prompt always produce the same decision, so repeating
+them is wasted latency and token spend. LLMCache stores successful
+responses keyed on a hash of everything that affects the output.
+
+Backends are pluggable: anything implementing CacheBackend (e.g. a Redis
+wrapper) can replace the default in-memory store.
+"""
+
+from typing import Any, Dict, List, Optional, Protocol
+from datetime import datetime
+import hashlib
+import logging
+import time
+
+import orjson
+from cachetools import LRUCache
+
+from .base import LLMResponse, ModelProvider
+
+logger = logging.getLogger(__name__)
+
+
+class CacheBackend(Protocol):
+    """Storage interface for cached LLM responses."""
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        ...
+
+    async def set(self, key: str, value: Dict[str, Any], ttl_seconds: float) -> None:
+        ...
+
+    async def delete(self, key: str) -> None:
+        ...
+
+    async def clear(self) -> None:
+        ...
+
+
+class InMemoryCacheBackend:
+    """
+    Process-local LRU cache backend with per-entry expiry.
+
+    Suitable for a single API instance; use a shared backend (Redis, etc.)
+    when running several replicas.
+    """
+
+    def __init__(self, max_size: int = 1000):
+        """
+        Initialize the in-memory backend.
+
+        Args:
+            max_size: Maximum number of cached responses
+        """
+        self._entries: LRUCache = LRUCache(maxsize=max_size)
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            self._entries.pop(key, None)
+            return None
+
+        return value
+
+    async def set(self, key: str, value: Dict[str, Any], ttl_seconds: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl_seconds, value)
+
+    async def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+
+
+class RedisCacheBackend:
+    """
+    Redis-backed cache shared by every API replica.
+
+    Requires the optional `redis` package (redis>=4.2 for redis.asyncio).
+    """
+
+    def __init__(self, url: str = "redis://localhost:6379/0", prefix: str = "trustchain:llm:"):
+        """
+        Initialize the Redis backend.
+
+        Args:
+            url: Redis connection URL
+            prefix: Key namespace for cached responses
+        """
+        from redis import asyncio as redis_asyncio  # Optional dependency
+
+        self._redis = redis_asyncio.from_url(url)
+        self._prefix = prefix
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        raw = await self._redis.get(self._prefix + key)
+        return orjson.loads(raw) if raw is not None else None
+
+    async def set(self, key: str, value: Dict[str, Any], ttl_seconds: float) -> None:
+        await self._redis.set(
+            self._prefix + key,
+            orjson.dumps(value),
+            px=max(1, int(ttl_seconds * 1000))
+        )
+
+    async def delete(self, key: str) -> None:
+        await self._redis.delete(self._prefix + key)
+
+    async def clear(self) -> None:
+        async for key in self._redis.scan_iter(match=self._prefix + "*"):
+            await self._redis.delete(key)
+
+
+class LLMCache:
+    """
+    Exact-match cache for LLM responses.
+
+    Only (near-)deterministic requests (temperature <= 0.01) are cached -
+    at higher temperatures each call is meant to be an independent sample,
+    which consensus relies on.
+
+    The cache fails open: a backend error (e.g. Redis down or timing out)
+    is logged and treated as a miss, never failing the provider call.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        ttl_seconds: float = 3600
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            backend: Storage backend (defaults to InMemoryCacheBackend)
+            ttl_seconds: How long a cached response stays valid
+        """
+        self.backend = backend or InMemoryCacheBackend()
+        self.ttl_seconds = ttl_seconds
+        self.stats = {"hits": 0, "misses": 0, "errors": 0}
+
+    @staticmethod
+    def cache_key(
+        provider: str,
+        model: str,
+        messages: List[Dict[str, Any]],
+        temperature: float,
+        max_tokens: int,
+        options: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Build a cache key from everything that affects the model output.
+
+        Args:
+            provider: Provider name (e.g. "anthropic")
+            model: Model identifier
+            messages: System/user messages sent to the model
+            temperature: Sampling temperature
+            max_tokens: Maximum output tokens
+            options: Other generation options forwarded to the API
+                (e.g. top_p, stop, response_format)
+
+        Returns:
+            SHA-256 hex digest identifying the request
+        """
+        request = {
+            "provider": provider,
+            "model": model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens
+        }
+        # Only added when present, so keys for plain requests are unchanged
+        if options:
+            request["options"] = options
+        payload = orjson.dumps(request, option=orjson.OPT_SORT_KEYS)
+        return hashlib.sha256(payload).hexdigest()
+
+    # Temperatures at or below this are treated as deterministic
+    DETERMINISTIC_TEMPERATURE = 0.01
+
+    @staticmethod
+    def is_cacheable(temperature: float) -> bool:
+        """Only (near-)deterministic requests are cached."""
+        return temperature <= LLMCache.DETERMINISTIC_TEMPERATURE
+
+    async def get(self, key: str) -> Optional[LLMResponse]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Key from cache_key()
+
+        Returns:
+            The cached LLMResponse (marked with metadata["cache_hit"]) or None
+        """
+        try:
+            value = await self.backend.get(key)
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.warning(f"⚠️  Cache lookup failed, treating as miss: {e}")
+            value = None
+
+        if value is None:
+            self.stats["misses"] += 1
+            return None
+
+        self.stats["hits"] += 1
+        return LLMResponse(
+            provider=ModelProvider(value["provider"]),
+            model_name=value["model_name"],
+            content=value["content"],
+            reasoning=value["reasoning"],
+            confidence=value["confidence"],
+            timestamp=datetime.fromisoformat(value["timestamp"]),
+            metadata={**value["metadata"], "cache_hit": True},
+            tokens_used=value["tokens_used"]
+        )
+
+    async def set(self, key: str, response: LLMResponse) -> None:
+        """
+        Store a successful response.
+
+        Args:
+            key: Key from cache_key()
+            response: Response to cache (error responses are skipped)
+        """
+        if response.error:
+            return
+
+        value = response.to_audit_dict()
+        value["metadata"] = response.metadata
+        try:
+            await self.backend.set(key, value, self.ttl_seconds)
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.warning(f"⚠️  Cache store failed, skipping: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters and hit rate."""
+        total = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "hit_rate": self.stats["hits"] / total if total else 0.0
+        }
@@ -12,7 +12,9 @@ commercial applications. See LICENSE for usage terms.
 from typing import Optional, Dict, Any
 import asyncio
 import logging
-from datetime import datetime
+import re
+from datetime import datetime, timezone
+from time import perf_counter
 
 from .base import BaseLLMProvider, LLMResponse, ProviderConfig, ModelProvider, ProviderStatus
 from .registry import register_provider
@@ -39,11 +41,21 @@ class CustomProvider(BaseLLMProvider):
     - Health monitoring
     """
 
+    # Keyword matchers, compiled once at class creation. One findall pass
+    # collects every keyword present; precedence is then applied in Python
+    # instead of lowercasing the response and scanning it once per keyword.
+    _DECISION_RE = re.compile(r"approve|grant|deny|reject", re.IGNORECASE)
+    _CONFIDENCE_RE = re.compile(
+        r"very confident|confident|uncertain|certain|not sure",
+        re.IGNORECASE
+    )
+
     def __init__(
         self,
         config: ProviderConfig,
         model: str = "your-default-model",  # e.g., "gemini-pro"
-        provider_name: str = "custom"  # lowercase identifier
+        provider_name: str = "custom",  # lowercase identifier
+        tokenizer_name: Optional[str] = None  # e.g., "mistralai/Mistral-7B-v0.1"
     ):
         """
         Initialize custom provider.
@@ -52,15 +64,23 @@ class CustomProvider(BaseLLMProvider):
             config: Provider configuration (API key, timeout, etc.)
             model: Default model to use
             provider_name: Unique identifier for this provider
+            tokenizer_name: Hugging Face tokenizer for local token counting,
+                only needed if your API doesn't report token usage
         """
         super().__init__(config)
         self.model = model
         self.provider_name = provider_name
+        self._provider_enum = ModelProvider(provider_name)  # Resolved once, reused per response
+        self.tokenizer_name = tokenizer_name
+        self._encoder = None  # Loaded on first use, see _count_tokens
 
         # STEP 2: Initialize your API client here
         # Example:
         # import your_sdk
-        # self.client = your_sdk.Client(api_key=config.api_key)
+        # self.client = your_sdk.Client(api_key=config.api_key, timeout=config.timeout_seconds)
+        #
+        # Enforce config.timeout_seconds in the client - the base class
+        # doesn't wrap API calls in its own timeout.
 
         logger.info(f"Initialized {provider_name} provider with model {model}")
 
@@ -86,7 +106,7 @@ class CustomProvider(BaseLLMProvider):
         Returns:
             LLMResponse with decision, reasoning, and confidence
         """
-        start_time = datetime.now()
+        start_time = perf_counter()
 
         try:
             # STEP 3: Make your API call
@@ -111,18 +131,19 @@ class CustomProvider(BaseLLMProvider):
             confidence = self._calculate_confidence(response_text)
 
             # STEP 5: Calculate metrics
-            latency_ms = (datetime.now() - start_time).total_seconds() * 1000
+            latency_ms = (perf_counter() - start_time) * 1000
 
             # STEP 6: Return structured response
             return LLMResponse(
-                provider=ModelProvider(self.provider_name),
+                provider=self._provider_enum,
                 model_name=self.model,
                 content=response_text,
                 reasoning=reasoning,
                 confidence=confidence,
-                timestamp=datetime.now(),
+                timestamp=datetime.now(timezone.utc),
                 latency_ms=latency_ms,
-                tokens_used=self._count_tokens(response_text),  # Implement token counting
+                # Prefer API-reported usage, e.g. response.usage.total_tokens
+                tokens_used=self._count_tokens(response_text),
                 metadata={
                     "temperature": temperature or self.config.temperature,
                     "max_tokens": max_tokens or self.config.max_tokens
@@ -135,12 +156,12 @@ class CustomProvider(BaseLLMProvider):
 
             # Return error response
             return LLMResponse(
-                provider=ModelProvider(self.provider_name),
+                provider=self._provider_enum,
                 model_name=self.model,
                 content="",
                 reasoning=None,
                 confidence=0.0,
-                timestamp=datetime.now(),
+                timestamp=datetime.now(timezone.utc),
                 error=str(e)
             )
 
@@ -148,23 +169,30 @@ class CustomProvider(BaseLLMProvider):
         """
         Check if your provider is healthy and responding.
 
+        The verdict is cached for config.health_ttl_seconds, so callers
+        polling health on every request don't pay for a real check each time.
+
         Returns:
             ProviderStatus (HEALTHY, DEGRADED, or UNAVAILABLE)
         """
+        cached = self._cached_health()
+        if cached is not None:
+            return cached
+
         try:
             # STEP 7: Implement health check
             # Example: Make a lightweight API call
             #
             # await self.client.health()
-            # return ProviderStatus.HEALTHY
+            # return self._store_health(ProviderStatus.HEALTHY)
 
             # Placeholder - replace with real health check
             await asyncio.sleep(0.1)  # Simulate API call
-            return ProviderStatus.HEALTHY
+            return self._store_health(ProviderStatus.HEALTHY)
 
         except Exception as e:
             logger.warning(f"{self.provider_name} health check failed: {str(e)}")
-            return ProviderStatus.UNAVAILABLE
+            return self._store_health(ProviderStatus.UNAVAILABLE)
 
     # ==================================================================
     # Helper methods (customize for your provider)
@@ -195,11 +223,11 @@ class CustomProvider(BaseLLMProvider):
         """
         # STEP 8: Implement decision parsing for your LLM
         # Example:
-        response_lower = response.lower()
+        found = {m.lower() for m in self._DECISION_RE.findall(response)}
 
-        if "approve" in response_lower or "grant" in response_lower:
+        if found & {"approve", "grant"}:
             return "approve"
-        elif "deny" in response_lower or "reject" in response_lower:
+        elif found & {"deny", "reject"}:
             return "deny"
         else:
             return "needs_review"
@@ -240,34 +268,50 @@ class CustomProvider(BaseLLMProvider):
         """
         # STEP 10: Implement confidence scoring
         # Example: Look for confidence keywords
-        response_lower = response.lower()
+        found = {m.lower() for m in self._CONFIDENCE_RE.findall(response)}
 
-        if "very confident" in response_lower or "certain" in response_lower:
+        if found & {"very confident", "certain"}:
             return 0.95
-        elif "confident" in response_lower:
+        elif "confident" in found:
             return 0.85
-        elif "uncertain" in response_lower or "not sure" in response_lower:
+        elif found & {"uncertain", "not sure"}:
             return 0.5
         else:
             return 0.7  # Default
 
     def _count_tokens(self, text: str) -> Optional[int]:
         """
-        Estimate token count for the response.
+        Count tokens in the response with the provider's tokenizer.
 
         Args:
             text: Response text
 
         Returns:
-            Approximate token count or None
+            Exact token count, or None if no tokenizer is configured
 
         Note:
-            - Use your provider's tokenizer if available
-            - Otherwise approximate: ~4 characters per token
+            - If your API reports token usage, use that instead
+            - Character-based estimates (len // 4) are badly off for most
+              tokenizers, so None is returned rather than a guess
         """
         # STEP 11: Implement token counting
-        # Simple approximation (replace with provider-specific tokenizer)
-        return len(text) // 4
+        # Uses the Rust-backed `tokenizers` package, loaded once per instance
+        if not self.tokenizer_name:
+            return None
+
+        if self._encoder is None:
+            try:
+                from tokenizers import Tokenizer
+                self._encoder = Tokenizer.from_pretrained(self.tokenizer_name)
+            except Exception as e:
+                logger.warning(
+                    f"Tokenizer {self.tokenizer_name} unavailable, "
+                    f"token counts disabled: {str(e)}"
+                )
+                self.tokenizer_name = None
+                return None
+
+        return len(self._encoder.encode(text).ids)
 
 
 # ==================================================================
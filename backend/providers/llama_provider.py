@@ -5,23 +5,34 @@ Implements local Llama model integration via Ollama for privacy-sensitive
 government decisions that require on-premises processing.
 """
 
-from typing import Optional, Dict, Any
-from datetime import datetime
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional
+from datetime import datetime, timezone
+from time import perf_counter
+import asyncio
 import logging
-import json
+import re
 
 import aiohttp
+import orjson
+from cachetools import LRUCache
 
+from .cache import LLMCache
 from .base import (
+    CERTAINTY_MARKERS_RE,
+    UNCERTAINTY_MARKERS_RE,
     BaseLLMProvider,
     LLMResponse,
     ModelProvider,
     ProviderConfig,
-    ProviderException
+    ProviderException,
+    count_distinct_markers
 )
 
 logger = logging.getLogger(__name__)
 
+# Request bodies are pre-encoded with orjson, so the content type is set by hand
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 class LlamaProvider(BaseLLMProvider):
     """
@@ -39,11 +50,20 @@ class LlamaProvider(BaseLLMProvider):
     LLAMA_3_8B = "llama3:8b"
     LLAMA_3_70B = "llama3:70b"
 
+    # Response markers, compiled once so each response is scanned in a
+    # single case-insensitive pass per marker group
+    _REASONING_RE = re.compile(
+        r"let me analyze|based on the information|here's my reasoning:"
+        r"|step by step:|analysis:|reasoning:",
+        re.IGNORECASE
+    )
+
     def __init__(
         self,
         config: ProviderConfig,
         model: str = LLAMA_2_13B,
-        ollama_base_url: str = "http://localhost:11434"
+        ollama_base_url: str = "http://localhost:11434",
+        cache: Optional[LLMCache] = None
     ):
         """
         Initialize Llama provider.
@@ -52,52 +72,133 @@ class LlamaProvider(BaseLLMProvider):
             config: Provider configuration
             model: Llama model to use (defaults to 13B for balanced performance)
             ollama_base_url: Base URL for Ollama API (defaults to localhost)
+            cache: Response cache for deterministic requests (defaults to an
+                in-memory LRU - local inference is the dominant cost here)
         """
-        super().__init__(ModelProvider.LLAMA, config)
+        super().__init__(
+            ModelProvider.LLAMA,
+            config,
+            cache=cache if cache is not None else LLMCache()
+        )
 
         self.model = model
         self.ollama_base_url = ollama_base_url.rstrip("/")
         self.api_endpoint = f"{self.ollama_base_url}/api/generate"
 
+        # Reused across calls for keep-alive; created lazily on the running loop
+        self._session: Optional[aiohttp.ClientSession] = None
+
+        # Generation options per (temperature, max_tokens) - reused because
+        # consecutive decisions almost always share the same settings
+        self._options_cache: LRUCache = LRUCache(maxsize=32)
+
         logger.info(
             f"Llama provider initialized with model: {model}, "
             f"Ollama URL: {ollama_base_url}"
         )
 
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the provider's shared HTTP session, creating it on first use.
+
+        Ollama serializes generate calls per model, so the pool limits
+        mostly matter for health polling (/api/tags) and multi-provider
+        fan-out; they are taken from ProviderConfig.
+
+        Returns:
+            aiohttp.ClientSession with a pooled keep-alive connector
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.config.timeout_seconds),
+                connector=aiohttp.TCPConnector(
+                    limit=self.config.max_connections,
+                    limit_per_host=self.config.max_connections_per_host,
+                    keepalive_timeout=self.config.keepalive_expiry,
+                    enable_cleanup_closed=True
+                )
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the shared HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def prewarm(self) -> None:
+        """
+        Open the HTTP connection and load the model before the first decision.
+
+        The first generate call otherwise pays for connection setup plus
+        Ollama's model load (load_duration), which is seconds for large
+        models. Failures are logged, not raised - Ollama may still be starting.
+        """
+        try:
+            session = await self._get_session()
+
+            # Establishes the keep-alive connection reused by later calls
+            async with session.get(f"{self.ollama_base_url}/api/tags") as response:
+                await response.read()
+
+            # An empty prompt makes Ollama load the model without generating
+            async with session.post(
+                self.api_endpoint,
+                data=orjson.dumps({"model": self.model, "prompt": "", "stream": False}),
+                headers=_JSON_HEADERS
+            ) as response:
+                await response.read()
+                if response.status != 200:
+                    logger.warning(
+                        f"Ollama prewarm of {self.model} returned status {response.status}"
+                    )
+                    return
+
+            logger.info(f"Ollama model {self.model} prewarmed")
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.warning(f"Ollama prewarm failed: {str(e)}")
+
     async def validate_api_key(self) -> bool:
         """
         Validate that Ollama is running and accessible.
 
+        A successful check is reused for config.health_ttl_seconds, so
+        frequent polling doesn't hit /api/tags every time.
+
         Returns:
             True if Ollama is reachable and the model is available
 
         Raises:
             ProviderException: If Ollama is not accessible
         """
+        if self._cached_health():
+            return True
+
         try:
             # Check if Ollama is running
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{self.ollama_base_url}/api/tags") as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        models = [m["name"] for m in data.get("models", [])]
-
-                        if self.model not in models:
-                            logger.warning(
-                                f"Model {self.model} not found in Ollama. "
-                                f"Available models: {models}"
-                            )
-                            # Don't fail validation - model might need to be pulled
-                            logger.info(f"Ollama is accessible. Model {self.model} may need to be pulled.")
-
-                        logger.info("Ollama validated successfully")
-                        return True
-                    else:
-                        raise ProviderException(
-                            f"Ollama returned status {response.status}",
-                            ModelProvider.LLAMA,
-                            recoverable=True
+            session = await self._get_session()
+            async with session.get(f"{self.ollama_base_url}/api/tags") as response:
+                if response.status == 200:
+                    data = orjson.loads(await response.read())
+                    models = [m["name"] for m in data.get("models", [])]
+
+                    if self.model not in models:
+                        logger.warning(
+                            f"Model {self.model} not found in Ollama. "
+                            f"Available models: {models}"
                         )
+                        # Don't fail validation - model might need to be pulled
+                        logger.info(f"Ollama is accessible. Model {self.model} may need to be pulled.")
+
+                    logger.info("Ollama validated successfully")
+                    return self._store_health(True)
+                else:
+                    raise ProviderException(
+                        f"Ollama returned status {response.status}",
+                        ModelProvider.LLAMA,
+                        recoverable=True
+                    )
 
         except aiohttp.ClientError as e:
             logger.error(f"Ollama connection failed: {str(e)}")
@@ -107,14 +208,14 @@ class LlamaProvider(BaseLLMProvider):
                 recoverable=True
             )
 
-    async def _make_api_call(
+    def _build_api_params(
         self,
         prompt: str,
         system_context: Optional[str] = None,
         **kwargs
-    ) -> LLMResponse:
+    ) -> Dict[str, Any]:
         """
-        Make API call to Ollama with proper error handling.
+        Build a streaming /api/generate request body.
 
         Args:
             prompt: The user prompt/question
@@ -122,103 +223,183 @@ class LlamaProvider(BaseLLMProvider):
             **kwargs: Additional parameters (temperature, max_tokens, etc.)
 
         Returns:
-            LLMResponse with Llama's decision and reasoning
+            JSON body for Ollama's generate endpoint
+        """
+        temperature = kwargs.get("temperature", self.config.temperature)
+        max_tokens = kwargs.get("max_tokens", self.config.max_tokens)
+
+        # Shared between requests - safe because it is only ever serialized
+        options = self._options_cache.get((temperature, max_tokens))
+        if options is None:
+            options = {"temperature": temperature, "num_predict": max_tokens}
+            self._options_cache[(temperature, max_tokens)] = options
+
+        # Prepare API parameters for Ollama
+        api_params = {
+            "model": self.model,
+            "prompt": prompt,
+            "stream": True,  # Newline-delimited JSON chunks as tokens are generated
+            "options": options
+        }
+
+        # Send system context as its own field - Ollama applies it through the
+        # model's chat template, so the (often long) policy text is never
+        # copied into a combined prompt string
+        if system_context:
+            api_params["system"] = system_context
+
+        return api_params
+
+    async def _stream_chunks(self, api_params: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Post a generate request and yield Ollama's streamed JSON chunks.
+
+        Each chunk carries a "response" text fragment; the final chunk has
+        "done": true plus timing and token counts.
+
+        Args:
+            api_params: Request body from _build_api_params
+
+        Yields:
+            Decoded chunk dictionaries, ending with the "done" chunk
 
         Raises:
-            ProviderException: If API call fails
+            ProviderException: On non-200 status, an "error" chunk, or a
+                stream that ends before the "done" chunk (all recoverable)
         """
-        start_time = datetime.now()
+        # Session timeout = config.timeout_seconds
+        session = await self._get_session()
+        async with session.post(
+            self.api_endpoint,
+            data=orjson.dumps(api_params),
+            headers=_JSON_HEADERS
+        ) as response:
+            if response.status != 200:
+                error_text = await response.text()
+                raise ProviderException(
+                    f"Ollama returned status {response.status}: {error_text}",
+                    ModelProvider.LLAMA,
+                    recoverable=True
+                )
+
+            async for line in response.content:
+                if not line.strip():
+                    continue
+
+                chunk = orjson.loads(line)
+                # Failures after the 200 header (e.g. the model runner
+                # crashing) arrive as an error line in the stream
+                if "error" in chunk:
+                    raise ProviderException(
+                        f"Ollama stream error: {chunk['error']}",
+                        ModelProvider.LLAMA,
+                        recoverable=True
+                    )
+
+                yield chunk
+                if chunk.get("done"):
+                    return
+
+        # A truncated response must not be treated (and cached) as complete
+        raise ProviderException(
+            "Ollama stream ended before the final chunk",
+            ModelProvider.LLAMA,
+            recoverable=True
+        )
 
-        try:
-            # Build the full prompt with system context
-            full_prompt = prompt
-            if system_context:
-                full_prompt = f"{system_context}\n\n{prompt}"
-
-            # Prepare API parameters for Ollama
-            api_params = {
-                "model": self.model,
-                "prompt": full_prompt,
-                "stream": False,  # Get complete response, not streaming
-                "options": {
-                    "temperature": kwargs.get("temperature", self.config.temperature),
-                    "num_predict": kwargs.get("max_tokens", self.config.max_tokens)
-                }
-            }
+    async def stream_decision(
+        self,
+        prompt: str,
+        system_context: Optional[str] = None,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """
+        Yield Llama's response text as it is generated.
 
-            logger.debug(f"Making Ollama API call with model: {self.model}")
-
-            # Make the API call
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    self.api_endpoint,
-                    json=api_params,
-                    timeout=aiohttp.ClientTimeout(total=self.config.timeout_seconds)
-                ) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        raise ProviderException(
-                            f"Ollama returned status {response.status}: {error_text}",
-                            ModelProvider.LLAMA,
-                            recoverable=True
-                        )
+        For live display only - this bypasses generate_decision's retries,
+        caching and metrics, so use generate_decision for recorded decisions.
 
-                    data = await response.json()
-
-            # Extract content from response
-            content = data.get("response", "")
-
-            # Parse reasoning if present
-            reasoning = self._extract_reasoning(content)
-
-            # Calculate confidence based on response characteristics
-            confidence = self._calculate_confidence(data, content)
-
-            # Estimate tokens used (Ollama doesn't always provide this)
-            tokens_used = data.get("eval_count", None)
-
-            llm_response = LLMResponse(
-                provider=ModelProvider.LLAMA,
-                model_name=self.model,
-                content=content,
-                reasoning=reasoning,
-                confidence=confidence,
-                timestamp=datetime.now(),
-                tokens_used=tokens_used,
-                metadata={
-                    "total_duration": data.get("total_duration"),
-                    "load_duration": data.get("load_duration"),
-                    "prompt_eval_count": data.get("prompt_eval_count"),
-                    "eval_count": data.get("eval_count"),
-                    "context": data.get("context", [])
-                }
-            )
+        Args:
+            prompt: The user prompt/question
+            system_context: System-level instructions (government policy context)
+            **kwargs: Additional parameters (temperature, max_tokens, etc.)
 
-            latency_ms = (datetime.now() - start_time).total_seconds() * 1000
-            logger.info(
-                f"Ollama API call successful - Latency: {latency_ms}ms, "
-                f"Tokens: {tokens_used}, Confidence: {confidence:.2f}"
-            )
+        Yields:
+            Text fragments in generation order
+        """
+        api_params = self._build_api_params(prompt, system_context, **kwargs)
+        async for chunk in self._stream_chunks(api_params):
+            text = chunk.get("response")
+            if text:
+                yield text
 
-            return llm_response
+    async def _make_api_call(
+        self,
+        prompt: str,
+        system_context: Optional[str] = None,
+        on_chunk: Optional[Callable[[str], Awaitable[None]]] = None,
+        **kwargs
+    ) -> LLMResponse:
+        """
+        Make API call to Ollama with proper error handling.
+
+        The response is streamed, so time to first token is recorded and
+        callers can process text incrementally via on_chunk.
+
+        Args:
+            prompt: The user prompt/question
+            system_context: System-level instructions (government policy context)
+            on_chunk: Optional async callback invoked with each streamed text chunk
+            **kwargs: Additional parameters (temperature, max_tokens, etc.)
+
+        Returns:
+            LLMResponse with Llama's decision and reasoning, or an error
+            result (metadata["recoverable"] = True) on connection failures
+            and timeouts
+
+        Raises:
+            ProviderException: On non-200 status, mid-stream errors,
+                truncated streams or malformed responses
+        """
+        start_time = perf_counter()
+        api_params = self._build_api_params(prompt, system_context, **kwargs)
+
+        logger.debug("Making Ollama API call with model: %s", self.model)
 
+        # Only the network I/O is guarded - parsing below is CPU-only, and a
+        # bug there should surface as itself rather than as a provider error
+        try:
+            # Stream the response, buffering chunks in a list (joined once)
+            parts = []
+            ttft_ms = None
+            data: Dict[str, Any] = {}
+            async for chunk in self._stream_chunks(api_params):
+                text = chunk.get("response")
+                if text:
+                    if ttft_ms is None:
+                        ttft_ms = (perf_counter() - start_time) * 1000
+                    parts.append(text)
+                    if on_chunk:
+                        await on_chunk(text)
+
+                # Final chunk carries durations and token counts
+                if chunk.get("done"):
+                    data = chunk
+
+        # Transient failures (a local Ollama server restarting, a dropped
+        # keep-alive connection) are common, so they are returned as error
+        # results for generate_decision to retry instead of being raised
         except aiohttp.ClientError as e:
             logger.error(f"Ollama connection error: {str(e)}")
-            raise ProviderException(
-                f"Connection failed: {str(e)}",
-                ModelProvider.LLAMA,
-                recoverable=True
-            )
+            return self._error_response(f"Connection failed: {str(e)}")
 
         except asyncio.TimeoutError as e:
             logger.error(f"Ollama request timeout: {str(e)}")
-            raise ProviderException(
-                f"Request timeout after {self.config.timeout_seconds}s",
-                ModelProvider.LLAMA,
-                recoverable=True
+            return self._error_response(
+                f"Request timeout after {self.config.timeout_seconds}s"
             )
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Invalid JSON response from Ollama: {str(e)}")
             raise ProviderException(
                 f"Invalid response format: {str(e)}",
@@ -226,13 +407,71 @@ class LlamaProvider(BaseLLMProvider):
                 recoverable=False
             )
 
-        except Exception as e:
-            logger.error(f"Unexpected error in Llama provider: {str(e)}")
-            raise ProviderException(
-                f"Unexpected error: {str(e)}",
-                ModelProvider.LLAMA,
-                recoverable=False
-            )
+        content = "".join(parts)
+
+        # Parse reasoning if present
+        reasoning = self._extract_reasoning(content)
+
+        # Calculate confidence based on response characteristics
+        confidence = self._calculate_confidence(data, content)
+
+        # Exact counts from Ollama (prompt + generated, like the other
+        # providers). prompt_eval_count is omitted when the prompt was
+        # served from Ollama's cache, so missing counts are not guessed.
+        prompt_tokens = data.get("prompt_eval_count")
+        output_tokens = data.get("eval_count")
+        if prompt_tokens is None and output_tokens is None:
+            tokens_used = None
+        else:
+            tokens_used = (prompt_tokens or 0) + (output_tokens or 0)
+
+        llm_response = LLMResponse(
+            provider=ModelProvider.LLAMA,
+            model_name=self.model,
+            content=content,
+            reasoning=reasoning,
+            confidence=confidence,
+            timestamp=datetime.now(timezone.utc),
+            tokens_used=tokens_used,
+            ttft_ms=ttft_ms,
+            metadata={
+                "total_duration": data.get("total_duration"),
+                "load_duration": data.get("load_duration"),
+                "prompt_eval_count": prompt_tokens,
+                "eval_count": output_tokens,
+                "context": data.get("context", [])
+            }
+        )
+
+        latency_ms = (perf_counter() - start_time) * 1000
+        # Lazy args - nothing is formatted unless a handler takes the record
+        logger.info(
+            "Ollama API call successful - Latency: %.1fms, Tokens: %s, Confidence: %.2f",
+            latency_ms, tokens_used, confidence
+        )
+
+        return llm_response
+
+    def _error_response(self, error: str) -> LLMResponse:
+        """
+        Build the error result returned for a recoverable API failure.
+
+        Args:
+            error: Description of the failure
+
+        Returns:
+            LLMResponse with `error` set and metadata["recoverable"] = True
+        """
+        return LLMResponse(
+            provider=ModelProvider.LLAMA,
+            model_name=self.model,
+            content="",
+            reasoning=None,
+            confidence=0.0,
+            timestamp=datetime.now(timezone.utc),
+            error=error,
+            metadata={"recoverable": True}
+        )
 
     def _extract_reasoning(self, content: str) -> Optional[str]:
         """
@@ -245,29 +484,16 @@ class LlamaProvider(BaseLLMProvider):
             Extracted reasoning or None if not found
         """
         # Look for common reasoning patterns
-        reasoning_markers = [
-            "Let me analyze",
-            "Based on the information",
-            "Here's my reasoning:",
-            "Step by step:",
-            "Analysis:",
-            "Reasoning:"
-        ]
-
-        for marker in reasoning_markers:
-            if marker.lower() in content.lower():
-                # Extract the reasoning section
-                parts = content.split(marker, 1)
-                if len(parts) > 1:
-                    reasoning_text = parts[1].split("\n\n")[0]
-                    return reasoning_text.strip()
+        match = self._REASONING_RE.search(content)
+        if match:
+            # Extract the reasoning section (up to the next blank line)
+            start = match.end()
+            end = content.find("\n\n", start)
+            return content[start:end if end != -1 else None].strip()
 
         # If no explicit reasoning section, return first paragraph
-        paragraphs = content.split("\n\n")
-        if len(paragraphs) > 1:
-            return paragraphs[0].strip()
-
-        return None
+        first, sep, _ = content.partition("\n\n")
+        return first.strip() if sep else None
 
     def _calculate_confidence(self, response_data: Dict[str, Any], content: str) -> float:
         """
@@ -290,24 +516,14 @@ class LlamaProvider(BaseLLMProvider):
         if eval_count > 0 and eval_count < self.config.max_tokens * 0.9:
             confidence += 0.1  # Response completed naturally
 
-        # Analyze language for certainty markers
-        certainty_markers = [
-            "clearly", "definitely", "certainly", "without doubt",
-            "conclusively", "unambiguous"
-        ]
-        uncertainty_markers = [
-            "might", "possibly", "perhaps", "unclear", "uncertain",
-            "difficult to determine", "depends on"
-        ]
-
-        content_lower = content.lower()
+        # Analyze language for certainty markers (each distinct marker counts once)
 
         # Boost confidence for certainty markers
-        certainty_count = sum(1 for marker in certainty_markers if marker in content_lower)
+        certainty_count = count_distinct_markers(CERTAINTY_MARKERS_RE, content)
         confidence += min(0.2, certainty_count * 0.05)
 
         # Reduce confidence for uncertainty markers
-        uncertainty_count = sum(1 for marker in uncertainty_markers if marker in content_lower)
+        uncertainty_count = count_distinct_markers(UNCERTAINTY_MARKERS_RE, content)
         confidence -= min(0.3, uncertainty_count * 0.1)
 
         # Local models generally have slightly lower confidence than commercial APIs
@@ -329,22 +545,23 @@ class LlamaProvider(BaseLLMProvider):
         try:
             logger.info(f"Attempting to pull model: {self.model}")
 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.ollama_base_url}/api/pull",
-                    json={"name": self.model, "stream": False},
-                    timeout=aiohttp.ClientTimeout(total=600)  # 10 min timeout for large models
-                ) as response:
-                    if response.status == 200:
-                        logger.info(f"Model {self.model} pulled successfully")
-                        return True
-                    else:
-                        error_text = await response.text()
-                        raise ProviderException(
-                            f"Failed to pull model: {error_text}",
-                            ModelProvider.LLAMA,
-                            recoverable=False
-                        )
+            session = await self._get_session()
+            async with session.post(
+                f"{self.ollama_base_url}/api/pull",
+                data=orjson.dumps({"name": self.model, "stream": False}),
+                headers=_JSON_HEADERS,
+                timeout=aiohttp.ClientTimeout(total=600)  # 10 min timeout for large models
+            ) as response:
+                if response.status == 200:
+                    logger.info(f"Model {self.model} pulled successfully")
+                    return True
+                else:
+                    error_text = await response.text()
+                    raise ProviderException(
+                        f"Failed to pull model: {error_text}",
+                        ModelProvider.LLAMA,
+                        recoverable=False
+                    )
 
         except Exception as e:
             logger.error(f"Error pulling model: {str(e)}")
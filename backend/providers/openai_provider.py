@@ -5,18 +5,39 @@ Implements the OpenAI API integration with production-ready error handling,
 response parsing, and government compliance features.
 """
 
-from typing import Optional, Dict, Any
-from datetime import datetime
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional
+from datetime import datetime, timezone
+from time import perf_counter
+import asyncio
+import hashlib
 import logging
+import re
+
+import httpx
+from openai import (
+    AsyncOpenAI,
+    APIError,
+    APIConnectionError,
+    APIStatusError,
+    APITimeoutError,
+    PermissionDeniedError,
+    RateLimitError
+)
 
-from openai import AsyncOpenAI, APIError, APIConnectionError, RateLimitError
-
+from .cache import LLMCache
+from .semantic_cache import SemanticCache
 from .base import (
+    CERTAINTY_MARKERS_RE,
+    UNCERTAINTY_MARKERS_RE,
     BaseLLMProvider,
     LLMResponse,
     ModelProvider,
     ProviderConfig,
-    ProviderException
+    ProviderException,
+    count_distinct_markers,
+    get_shared_http_client,
+    parse_retry_after,
+    truncate_for_log
 )
 
 logger = logging.getLogger(__name__)
@@ -36,10 +57,24 @@ class OpenAIProvider(BaseLLMProvider):
     GPT_4O = "gpt-4o"
     GPT_35_TURBO = "gpt-3.5-turbo"
 
+    # Reasoning section markers, compiled once at class creation. A single
+    # search finds the earliest marker instead of one find() per marker.
+    _REASONING_RE = re.compile(
+        r"Let me analyze|Based on my analysis|Here's my reasoning:"
+        r"|Step-by-step:|Analysis:|Reasoning:"
+    )
+
+    # OpenAI also accepts these sampling and output-format options
+    _REQUEST_OPTIONS = frozenset(
+        {"max_tokens", "temperature", "top_p", "stop", "seed", "response_format"}
+    )
+
     def __init__(
         self,
         config: ProviderConfig,
-        model: str = GPT_4O
+        model: str = GPT_4O,
+        cache: Optional[LLMCache] = None,
+        semantic_cache: Optional[SemanticCache] = None
     ):
         """
         Initialize OpenAI provider.
@@ -47,8 +82,17 @@ class OpenAIProvider(BaseLLMProvider):
         Args:
             config: Provider configuration with API key
             model: GPT model to use (defaults to GPT-4o for best performance)
+            cache: Response cache for deterministic requests (defaults to an
+                in-memory LRU - a hit skips a full network round trip)
+            semantic_cache: Optional paraphrase-matching cache (off by default;
+                needs sentence-transformers)
         """
-        super().__init__(ModelProvider.OPENAI, config)
+        super().__init__(
+            ModelProvider.OPENAI,
+            config,
+            cache=cache if cache is not None else LLMCache(),
+            semantic_cache=semantic_cache
+        )
 
         if not config.api_key:
             raise ProviderException(
@@ -58,13 +102,36 @@ class OpenAIProvider(BaseLLMProvider):
             )
 
         self.model = model
-        self.client = AsyncOpenAI(api_key=config.api_key)
+
+        # Per-call params only add messages/options on top of these
+        self._base_params = {
+            "model": model,
+            "max_tokens": config.max_tokens,
+            "temperature": config.temperature,
+            "stream": True
+        }
+
+        # Fail fast when connecting or waiting for a pooled connection;
+        # reads get the full budget since generation can take a while.
+        # The SDK's own retries are off - generate_decision already retries
+        # with backoff, and stacking both multiplies attempts (3 x 3).
+        self.client = AsyncOpenAI(
+            api_key=config.api_key,
+            timeout=httpx.Timeout(config.timeout_seconds, connect=5.0, pool=5.0),
+            max_retries=0,
+            http_client=get_shared_http_client()
+        )
 
         logger.info(f"OpenAI provider initialized with model: {model}")
 
     async def validate_api_key(self) -> bool:
         """
-        Validate the OpenAI API key by making a minimal test request.
+        Validate the OpenAI API key with a metadata-only model lookup.
+
+        Retrieving the model authenticates the key and confirms the model
+        is available without generating (no latency or tokens billed).
+        Keys restricted from model endpoints fall back to a 1-token
+        completion.
 
         Returns:
             True if API key is valid and service is reachable
@@ -73,14 +140,18 @@ class OpenAIProvider(BaseLLMProvider):
             ProviderException: If API key is invalid
         """
         try:
-            # Make a minimal request to validate credentials
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                max_tokens=10,
-                messages=[{"role": "user", "content": "test"}]
-            )
-
-            logger.info("OpenAI API key validated successfully")
+            try:
+                await self.client.models.retrieve(self.model)
+                method = "models.retrieve"
+            except PermissionDeniedError:
+                await self.client.chat.completions.create(
+                    model=self.model,
+                    max_tokens=1,
+                    messages=[{"role": "user", "content": "test"}]
+                )
+                method = "1-token completion"
+
+            logger.info(f"OpenAI API key validated successfully (via {method})")
             return True
 
         except APIError as e:
@@ -91,18 +162,96 @@ class OpenAIProvider(BaseLLMProvider):
                 recoverable=False
             )
 
+    def _build_api_params(
+        self,
+        prompt: str,
+        system_context: Optional[str] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Build streaming chat completion parameters.
+
+        Args:
+            prompt: The user prompt/question
+            system_context: System-level instructions (government policy context)
+            **kwargs: Additional parameters (temperature, max_tokens, etc.)
+
+        Returns:
+            Keyword arguments for chat.completions.create
+        """
+        # Build the messages array for GPT in one literal, with the system
+        # context first if provided (critical for government decision-making)
+        messages = [
+            {"role": "system", "content": system_context},
+            {"role": "user", "content": prompt}
+        ] if system_context else [{"role": "user", "content": prompt}]
+
+        # Sent via extra_body because this SDK version predates these arguments
+        extra_body: Dict[str, Any] = {
+            "stream_options": {"include_usage": True}  # Final usage chunk
+        }
+
+        # Route requests sharing a policy prefix to the same server-side
+        # prompt cache, so the system context isn't re-processed per case
+        if system_context:
+            extra_body["prompt_cache_key"] = hashlib.sha256(
+                system_context.encode()
+            ).hexdigest()
+
+        # Start from the precomputed defaults, overriding only the
+        # supported options the caller passed
+        api_params = self._base_params | {
+            "messages": messages,
+            "extra_body": extra_body
+        }
+        for option in self._REQUEST_OPTIONS.intersection(kwargs):
+            api_params[option] = kwargs[option]
+
+        return api_params
+
+    async def stream_decision(
+        self,
+        prompt: str,
+        system_context: Optional[str] = None,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """
+        Yield GPT's response text as it is generated.
+
+        For live display only - this bypasses generate_decision's retries,
+        caching and metrics, so use generate_decision for recorded decisions.
+
+        Args:
+            prompt: The user prompt/question
+            system_context: System-level instructions (government policy context)
+            **kwargs: Additional parameters (temperature, max_tokens, etc.)
+
+        Yields:
+            Text fragments in generation order
+        """
+        api_params = self._build_api_params(prompt, system_context, **kwargs)
+        stream = await self.client.chat.completions.create(**api_params)
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
     async def _make_api_call(
         self,
         prompt: str,
         system_context: Optional[str] = None,
+        on_chunk: Optional[Callable[[str], Awaitable[None]]] = None,
         **kwargs
     ) -> LLMResponse:
         """
         Make API call to GPT with proper error handling.
 
+        The response is streamed, so time to first token is recorded and
+        callers can process text incrementally via on_chunk.
+
         Args:
             prompt: The user prompt/question
             system_context: System-level instructions (government policy context)
+            on_chunk: Optional async callback invoked with each streamed text chunk
             **kwargs: Additional parameters (temperature, max_tokens, etc.)
 
         Returns:
@@ -111,44 +260,67 @@ class OpenAIProvider(BaseLLMProvider):
         Raises:
             ProviderException: If API call fails
         """
-        start_time = datetime.now()
+        start_time = perf_counter()
 
         try:
-            # Build the messages array for GPT
-            messages = []
-
-            # Add system context if provided (critical for government decision-making)
-            if system_context:
-                messages.append({"role": "system", "content": system_context})
-
-            messages.append({"role": "user", "content": prompt})
-
-            # Prepare API parameters
-            api_params = {
-                "model": self.model,
-                "max_tokens": kwargs.get("max_tokens", self.config.max_tokens),
-                "temperature": kwargs.get("temperature", self.config.temperature),
-                "messages": messages
-            }
-
-            logger.debug(f"Making OpenAI API call with params: {api_params}")
-
-            # Make the API call
-            response = await self.client.chat.completions.create(**api_params)
-
-            # Extract content from response
-            content = response.choices[0].message.content or ""
+            api_params = self._build_api_params(prompt, system_context, **kwargs)
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Making OpenAI API call with params: %s",
+                    truncate_for_log(api_params)
+                )
+
+            # Stream the response, buffering chunks in a list (joined once)
+            parts = []
+            ttft_ms = None
+            finish_reason = None
+            model_id = None
+            usage = None
+            # timeout_seconds only bounds each read; this bounds the whole
+            # stream so a slowly trickling response can't hold a slot forever
+            async with asyncio.timeout(self.config.timeout_seconds):
+                stream = await self.client.chat.completions.create(**api_params)
+                async with stream:  # Closes the connection if the timeout fires
+                    async for chunk in stream:
+                        model_id = chunk.model
+                        if chunk.choices:
+                            choice = chunk.choices[0]
+                            text = choice.delta.content
+                            if text:
+                                if ttft_ms is None:
+                                    ttft_ms = (perf_counter() - start_time) * 1000
+                                parts.append(text)
+                                if on_chunk:
+                                    await on_chunk(text)
+                            if choice.finish_reason:
+                                finish_reason = choice.finish_reason
+
+                        # Final chunk (no choices) carries token usage
+                        chunk_usage = getattr(chunk, "usage", None)
+                        if chunk_usage:
+                            usage = chunk_usage
+
+            content = "".join(parts)
 
             # Parse reasoning if present
             reasoning = self._extract_reasoning(content)
 
             # Calculate confidence based on response characteristics
-            confidence = self._calculate_confidence(response, content)
-
-            # Calculate tokens used for cost tracking and auditing
+            confidence = self._calculate_confidence(finish_reason, content)
+
+            # Calculate tokens used for cost tracking and auditing. Usage is
+            # an untyped extra field on this SDK's chunk model (a plain dict)
+            if isinstance(usage, dict):
+                prompt_tokens = usage.get("prompt_tokens")
+                completion_tokens = usage.get("completion_tokens")
+            else:
+                prompt_tokens = getattr(usage, "prompt_tokens", None)
+                completion_tokens = getattr(usage, "completion_tokens", None)
             tokens_used = (
-                response.usage.prompt_tokens + response.usage.completion_tokens
-                if response.usage else None
+                prompt_tokens + completion_tokens
+                if prompt_tokens is not None and completion_tokens is not None
+                else None
             )
 
             llm_response = LLMResponse(
@@ -157,19 +329,20 @@ class OpenAIProvider(BaseLLMProvider):
                 content=content,
                 reasoning=reasoning,
                 confidence=confidence,
-                timestamp=datetime.now(),
+                timestamp=datetime.now(timezone.utc),
                 tokens_used=tokens_used,
+                ttft_ms=ttft_ms,
                 metadata={
-                    "finish_reason": response.choices[0].finish_reason,
-                    "prompt_tokens": response.usage.prompt_tokens if response.usage else None,
-                    "completion_tokens": response.usage.completion_tokens if response.usage else None,
-                    "model_id": response.model
+                    "finish_reason": finish_reason,
+                    "prompt_tokens": prompt_tokens,
+                    "completion_tokens": completion_tokens,
+                    "model_id": model_id
                 }
             )
 
             logger.info(
-                f"OpenAI API call successful - Tokens: {tokens_used}, "
-                f"Confidence: {confidence:.2f}"
+                "OpenAI API call successful - Tokens: %s, Confidence: %.2f",
+                tokens_used, confidence
             )
 
             return llm_response
@@ -179,6 +352,23 @@ class OpenAIProvider(BaseLLMProvider):
             raise ProviderException(
                 f"Rate limit exceeded: {str(e)}",
                 ModelProvider.OPENAI,
+                recoverable=True,
+                retry_after=parse_retry_after(e.response.headers)
+            )
+
+        except APITimeoutError as e:
+            logger.warning(f"OpenAI request timeout: {str(e)}")
+            raise ProviderException(
+                f"Request timeout after {self.config.timeout_seconds}s",
+                ModelProvider.OPENAI,
+                recoverable=True
+            )
+
+        except TimeoutError:
+            logger.warning("OpenAI response not completed within %ss", self.config.timeout_seconds)
+            raise ProviderException(
+                f"Response not completed within {self.config.timeout_seconds}s",
+                ModelProvider.OPENAI,
                 recoverable=True
             )
 
@@ -190,6 +380,18 @@ class OpenAIProvider(BaseLLMProvider):
                 recoverable=True
             )
 
+        except APIStatusError as e:
+            # 5xx (InternalServerError) and 529 overloaded are transient; the
+            # client has max_retries=0, so the base retry loop must see them
+            recoverable = e.status_code >= 500
+            logger.error(f"OpenAI API error ({e.status_code}): {str(e)}")
+            raise ProviderException(
+                f"API error: {str(e)}",
+                ModelProvider.OPENAI,
+                recoverable=recoverable,
+                retry_after=parse_retry_after(e.response.headers) if recoverable else None
+            )
+
         except APIError as e:
             logger.error(f"OpenAI API error: {str(e)}")
             raise ProviderException(
@@ -219,33 +421,19 @@ class OpenAIProvider(BaseLLMProvider):
         Returns:
             Extracted reasoning or None if not found
         """
-        # Look for common reasoning patterns GPT uses
-        reasoning_markers = [
-            "Let me analyze",
-            "Based on my analysis",
-            "Here's my reasoning:",
-            "Step-by-step:",
-            "Analysis:",
-            "Reasoning:"
-        ]
-
-        for marker in reasoning_markers:
-            if marker.lower() in content.lower():
-                # Extract the reasoning section
-                parts = content.split(marker, 1)
-                if len(parts) > 1:
-                    # Get text after marker until decision/conclusion
-                    reasoning_text = parts[1].split("\n\n")[0]
-                    return reasoning_text.strip()
+        # Look for common reasoning patterns GPT uses (one scan for all markers)
+        match = self._REASONING_RE.search(content)
+        if match:
+            # Get text after marker until decision/conclusion
+            start = match.end()
+            end = content.find("\n\n", start)
+            return content[start:end if end != -1 else None].strip()
 
         # If no explicit reasoning section, return first paragraph as implicit reasoning
-        paragraphs = content.split("\n\n")
-        if len(paragraphs) > 1:
-            return paragraphs[0].strip()
-
-        return None
+        first, sep, _ = content.partition("\n\n")
+        return first.strip() if sep else None
 
-    def _calculate_confidence(self, response: Any, content: str) -> float:
+    def _calculate_confidence(self, finish_reason: Optional[str], content: str) -> float:
         """
         Calculate confidence score based on response characteristics.
 
@@ -253,7 +441,7 @@ class OpenAIProvider(BaseLLMProvider):
         certainty markers to estimate decision confidence.
 
         Args:
-            response: The OpenAI API response
+            finish_reason: Why generation stopped ("stop", "length", ...)
             content: Extracted text content
 
         Returns:
@@ -262,30 +450,17 @@ class OpenAIProvider(BaseLLMProvider):
         confidence = 0.5  # Start at neutral
 
         # Higher confidence if response completed naturally
-        finish_reason = response.choices[0].finish_reason
         if finish_reason == "stop":
             confidence += 0.2
         elif finish_reason == "length":
             confidence -= 0.1  # Incomplete response reduces confidence
 
-        # Analyze language for certainty markers
-        certainty_markers = [
-            "clearly", "definitely", "certainly", "without doubt",
-            "conclusively", "unambiguous"
-        ]
-        uncertainty_markers = [
-            "might", "possibly", "perhaps", "unclear", "uncertain",
-            "difficult to determine", "depends on"
-        ]
-
-        content_lower = content.lower()
-
         # Boost confidence for certainty markers
-        certainty_count = sum(1 for marker in certainty_markers if marker in content_lower)
+        certainty_count = count_distinct_markers(CERTAINTY_MARKERS_RE, content)
         confidence += min(0.2, certainty_count * 0.05)
 
         # Reduce confidence for uncertainty markers
-        uncertainty_count = sum(1 for marker in uncertainty_markers if marker in content_lower)
+        uncertainty_count = count_distinct_markers(UNCERTAINTY_MARKERS_RE, content)
         confidence -= min(0.3, uncertainty_count * 0.1)
 
         # Ensure confidence stays in valid range
@@ -311,41 +486,12 @@ class OpenAIProvider(BaseLLMProvider):
         Returns:
             LLMResponse with structured decision and per-criterion evaluation
         """
-        # Build enhanced prompt with structured output requirements
-        structured_prompt = f"""
-{prompt}
-
-Please evaluate this case against the following criteria and provide:
-1. A decision (APPROVE/DENY/NEEDS_REVIEW)
-2. Reasoning for each criterion
-3. Overall confidence in the decision
-
-Criteria to evaluate:
-{self._format_criteria(decision_criteria)}
-
-Provide your response in the following structure:
-- Decision: [APPROVE/DENY/NEEDS_REVIEW]
-- Reasoning: [Step-by-step analysis]
-- Criterion Evaluations: [For each criterion]
-- Confidence: [High/Medium/Low]
-"""
+        # Criteria and output instructions are the same for every case in a
+        # program, so they go in the system context (the prompt-cached prefix)
+        # and only the per-case details go in the user prompt
+        structured_system = f"{system_context}\n\n{self._criteria_instructions(decision_criteria)}"
 
         return await self.generate_decision(
-            prompt=structured_prompt,
-            system_context=system_context
+            prompt=prompt,
+            system_context=structured_system
         )
-
-    def _format_criteria(self, criteria: Dict[str, Any]) -> str:
-        """
-        Format decision criteria for prompt inclusion.
-
-        Args:
-            criteria: Dictionary of evaluation criteria
-
-        Returns:
-            Formatted criteria string
-        """
-        formatted = []
-        for key, value in criteria.items():
-            formatted.append(f"- {key}: {value}")
-        return "\n".join(formatted)
@@ -6,13 +6,44 @@ making it easy to add support for new AI models without
 modifying core orchestration code.
 """
 
-from typing import Dict, Type, List, Optional
-from .base import BaseLLMProvider, ProviderConfig, ModelProvider
+from typing import Any, Dict, Type, List, Optional, Tuple, Union
+from .base import BaseLLMProvider, LLMResponse, ProviderConfig, ModelProvider
+import asyncio
+import importlib
 import logging
+import sys
 
 logger = logging.getLogger(__name__)
 
 
+class _LazyProvider:
+    """
+    Placeholder for a built-in provider class that is imported on first use.
+
+    Each provider module pulls in its SDK (anthropic, openai, aiohttp), so
+    deferring the import means a deployment only pays for the SDKs of the
+    providers it actually creates.
+    """
+
+    __slots__ = ("module", "__name__")
+
+    def __init__(self, module: str, class_name: str):
+        self.module = module
+        self.__name__ = class_name
+
+    def resolve(self) -> Type[BaseLLMProvider]:
+        """Import the module and return the validated provider class."""
+        provider_class = getattr(
+            importlib.import_module(self.module, __package__), self.__name__
+        )
+        if not issubclass(provider_class, BaseLLMProvider):
+            raise ValueError(
+                f"Provider class must inherit from BaseLLMProvider, "
+                f"got {provider_class.__name__}"
+            )
+        return provider_class
+
+
 class ProviderRegistry:
     """
     Central registry for LLM providers.
@@ -29,12 +60,22 @@ class ProviderRegistry:
         # Get provider class
         provider_class = registry.get("gemini")
         provider = provider_class(config)
+
+    Provider names are case-insensitive ("OpenAI" and "openai" are the
+    same provider).
     """
 
+    __slots__ = ("_entries", "_instances")
+
     def __init__(self):
         """Initialize empty registry."""
-        self._providers: Dict[str, Type[BaseLLMProvider]] = {}
-        self._provider_metadata: Dict[str, Dict] = {}
+        # name -> (provider class, metadata), so a lookup is one dict probe
+        # (built-ins start as _LazyProvider placeholders until first get())
+        self._entries: Dict[str, Tuple[Type[BaseLLMProvider], Dict]] = {}
+
+        # (name, config) -> provider instance, so clients and their
+        # keep-alive connection pools are reused across calls
+        self._instances: Dict[Tuple[str, ProviderConfig], BaseLLMProvider] = {}
 
     def register(
         self,
@@ -64,22 +105,25 @@ class ProviderRegistry:
                 }
             )
         """
-        # Validate provider class
-        if not issubclass(provider_class, BaseLLMProvider):
+        # Validate provider class (lazy built-ins are validated when resolved)
+        if not isinstance(provider_class, _LazyProvider) and not issubclass(
+            provider_class, BaseLLMProvider
+        ):
             raise ValueError(
                 f"Provider class must inherit from BaseLLMProvider, "
                 f"got {provider_class.__name__}"
             )
 
+        name = sys.intern(name.lower())
+
         # Check for duplicates
-        if name in self._providers:
+        if name in self._entries:
             logger.warning(
                 f"Provider '{name}' already registered, overwriting with {provider_class.__name__}"
             )
 
         # Register provider
-        self._providers[name] = provider_class
-        self._provider_metadata[name] = metadata or {}
+        self._entries[name] = (provider_class, metadata or {})
 
         logger.info(
             f"Registered provider: {name} ({provider_class.__name__})"
@@ -95,11 +139,9 @@ class ProviderRegistry:
         Raises:
             KeyError: If provider not found
         """
-        if name not in self._providers:
+        if self._entries.pop(name.lower(), None) is None:
             raise KeyError(f"Provider '{name}' not registered")
 
-        del self._providers[name]
-        del self._provider_metadata[name]
         logger.info(f"Unregistered provider: {name}")
 
     def get(self, name: str) -> Type[BaseLLMProvider]:
@@ -119,25 +161,33 @@ class ProviderRegistry:
             provider_class = registry.get("anthropic")
             provider = provider_class(config)
         """
-        if name not in self._providers:
+        key = name.lower()
+        entry = self._entries.get(key)
+        if entry is None:
             available = ", ".join(self.list_providers())
             raise KeyError(
                 f"Provider '{name}' not found. Available: {available}"
             )
 
-        return self._providers[name]
+        provider_class, metadata = entry
+        if isinstance(provider_class, _LazyProvider):
+            provider_class = provider_class.resolve()
+            self._entries[key] = (provider_class, metadata)
+
+        return provider_class
 
     def get_metadata(self, name: str) -> Dict:
         """Get provider metadata."""
-        return self._provider_metadata.get(name, {})
+        entry = self._entries.get(name.lower())
+        return entry[1] if entry is not None else {}
 
     def list_providers(self) -> List[str]:
         """Get list of all registered provider names."""
-        return list(self._providers.keys())
+        return list(self._entries)
 
     def is_registered(self, name: str) -> bool:
-        """Check if a provider is registered."""
-        return name in self._providers
+        """Check if a provider is registered (case-insensitive)."""
+        return name.lower() in self._entries
 
     def create_provider(
         self,
@@ -145,7 +195,11 @@ class ProviderRegistry:
         config: ProviderConfig
     ) -> BaseLLMProvider:
         """
-        Convenience method to create a provider instance.
+        Convenience method to get a provider instance.
+
+        Instances are pooled: asking again with the same name and an equal
+        config returns the existing provider (and its warm HTTP connections)
+        instead of constructing a new client.
 
         Args:
             name: Provider identifier
@@ -158,8 +212,71 @@ class ProviderRegistry:
             config = ProviderConfig(api_key="sk-...")
             provider = registry.create_provider("anthropic", config)
         """
-        provider_class = self.get(name)
-        return provider_class(config)
+        # ProviderConfig is frozen, so it is hashable and can't drift after
+        # the instance was built from it
+        key = (name.lower(), config)
+        provider = self._instances.get(key)
+        if provider is None:
+            provider = self.get(name)(config)
+            self._instances[key] = provider
+        return provider
+
+    async def aclose(self) -> None:
+        """Close all pooled provider instances (call on application shutdown)."""
+        instances = list(self._instances.values())
+        self._instances.clear()
+        for provider in instances:
+            await provider.close()
+
+    async def fanout(
+        self,
+        names: List[str],
+        prompt: str,
+        system_context: Optional[str] = None,
+        *,
+        configs: Dict[str, ProviderConfig],
+        max_workers: int = 16,
+        **kwargs: Any
+    ) -> List[Union[LLMResponse, Exception]]:
+        """
+        Ask several providers the same question concurrently.
+
+        Wall-clock time is the slowest provider's latency rather than the
+        sum of all of them. Results are in the same order as `names`; a
+        provider that raises yields its exception instead of failing the
+        whole fan-out.
+
+        Args:
+            names: Provider identifiers to query
+            prompt: The decision prompt
+            system_context: Government policy context and requirements
+            configs: Configuration for each provider, keyed by name
+            max_workers: Maximum number of provider calls in flight
+            **kwargs: Passed through to generate_decision
+
+        Returns:
+            One LLMResponse (or exception) per name
+
+        Example:
+            responses = await registry.fanout(
+                ["anthropic", "openai"],
+                prompt="Should this claim be approved?",
+                configs={"anthropic": claude_config, "openai": gpt_config}
+            )
+        """
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def ask(name: str) -> LLMResponse:
+            provider = self.create_provider(name, configs[name])
+            async with semaphore:
+                return await provider.generate_decision(
+                    prompt, system_context, **kwargs
+                )
+
+        return await asyncio.gather(
+            *(ask(name) for name in names),
+            return_exceptions=True
+        )
 
 
 # Global registry instance
@@ -181,14 +298,10 @@ def get_global_registry() -> ProviderRegistry:
 
 
 def _register_builtin_providers(registry: ProviderRegistry) -> None:
-    """Register built-in TrustChain providers."""
-    from .anthropic_provider import AnthropicProvider
-    from .openai_provider import OpenAIProvider
-    from .llama_provider import LlamaProvider
-
+    """Register built-in TrustChain providers (imported on first use)."""
     registry.register(
         "anthropic",
-        AnthropicProvider,
+        _LazyProvider(".anthropic_provider", "AnthropicProvider"),
         metadata={
             "description": "Anthropic Claude models",
             "models": ["claude-opus-4", "claude-sonnet-4", "claude-sonnet-3-5", "claude-haiku-3-5"],
@@ -200,7 +313,7 @@ def _register_builtin_providers(registry: ProviderRegistry) -> None:
 
     registry.register(
         "openai",
-        OpenAIProvider,
+        _LazyProvider(".openai_provider", "OpenAIProvider"),
         metadata={
             "description": "OpenAI GPT models",
             "models": ["gpt-4", "gpt-4-turbo", "gpt-4o"],
@@ -212,7 +325,7 @@ def _register_builtin_providers(registry: ProviderRegistry) -> None:
 
     registry.register(
         "llama",
-        LlamaProvider,
+        _LazyProvider(".llama_provider", "LlamaProvider"),
         metadata={
             "description": "Local Llama models via Ollama",
             "models": ["llama3.1", "llama3.1:70b", "llama2"],
@@ -0,0 +1,218 @@
+"""
+Semantic response cache for TrustChain providers.
+
+The exact-match LLMCache misses paraphrases ("Is the applicant eligible
+for UI?" vs "Does this case meet UI eligibility?"). SemanticCache embeds
+each request with a small local sentence-embedding model and serves a
+cached response when a previous request is similar enough.
+
+Only the prompt (the case details) is embedded: the embedding model
+truncates long inputs, and a policy-length system context would push the
+case details out of the window. Entries are instead scoped by a hash of
+provider, model, system context and temperature, and only compared
+within the same scope.
+
+Decisions hinge on specifics, so a match is also rejected whenever the
+numbers (dollar amounts, dates, percentages) or the "Field: value" lines
+of the two prompts differ - two cases that read alike but differ in
+income or in "Available for Work: True/False" must never share a decision.
+
+Requires the optional `sentence-transformers` package (which brings
+numpy); it is only imported when a SemanticCache is created.
+"""
+
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+from dataclasses import replace
+import asyncio
+import hashlib
+import logging
+import re
+import time
+
+import orjson
+
+from .base import LLMResponse
+
+logger = logging.getLogger(__name__)
+
+# Numbers, amounts, dates and percentages that must match exactly
+_CRITICAL_TOKEN_RE = re.compile(r"\$?\d[\d,./:-]*%?")
+
+# "Field: value" lines (optionally bulleted) whose values must match exactly
+_FIELD_RE = re.compile(
+    r"^[ \t]*(?:[-*][ \t]*)?([^:\n]+?)[ \t]*:[ \t]*(\S[^\n]*?)[ \t]*$",
+    re.MULTILINE
+)
+
+# Loaded models, shared by every cache using the same model name
+_models: Dict[str, Any] = {}
+
+
+def _get_model(model_name: str) -> Any:
+    """Load a sentence-embedding model once per process."""
+    model = _models.get(model_name)
+    if model is None:
+        from sentence_transformers import SentenceTransformer  # Optional dependency
+
+        model = SentenceTransformer(model_name)
+        _models[model_name] = model
+        logger.info(f"Loaded embedding model {model_name} for semantic cache")
+    return model
+
+
+def _fingerprint(prompt: str) -> FrozenSet[str]:
+    """Numbers and field values two prompts must share to match."""
+    return frozenset(_CRITICAL_TOKEN_RE.findall(prompt)).union(
+        f"{name}: {value}" for name, value in _FIELD_RE.findall(prompt)
+    )
+
+
+class SemanticCache:
+    """
+    Similarity-based cache for low-temperature LLM responses.
+
+    Embeddings are L2-normalized and kept in a fixed-size ring buffer, so a
+    lookup is one matrix-vector product (cosine similarity) over at most
+    max_entries rows. When full, the oldest entry is overwritten.
+    """
+
+    # Requests sampled above this temperature are never served from here
+    MAX_TEMPERATURE = 0.2
+
+    def __init__(
+        self,
+        threshold: float = 0.92,
+        max_entries: int = 1000,
+        ttl_seconds: float = 3600,
+        model_name: str = "all-MiniLM-L6-v2"
+    ):
+        """
+        Initialize the semantic cache.
+
+        Args:
+            threshold: Minimum cosine similarity to count as a hit
+            max_entries: Maximum number of cached responses
+            ttl_seconds: How long a cached response stays valid
+            model_name: sentence-transformers model used for embeddings
+        """
+        import numpy as np  # Installed with sentence-transformers
+
+        self._np = np
+        self._model = _get_model(model_name)
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+
+        self._embeddings = None  # (max_entries, dim) matrix, allocated on first add
+        self._entries: List[Tuple[float, str, FrozenSet[str], LLMResponse]] = []
+        self._next_slot = 0
+        self.stats = {"hits": 0, "misses": 0, "rejected": 0}
+
+    @staticmethod
+    def scope(
+        provider: str,
+        model: str,
+        system_context: Optional[str],
+        temperature: float
+    ) -> str:
+        """
+        Key for everything besides the prompt that affects the output.
+
+        Only entries with the same scope are compared against each other.
+        """
+        payload = orjson.dumps([provider, model, system_context, temperature])
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    async def _embed(self, text: str) -> Any:
+        """Embed text off the event loop (model inference is CPU-bound)."""
+        return await asyncio.to_thread(
+            self._model.encode, text, normalize_embeddings=True
+        )
+
+    async def get(self, scope: str, prompt: str) -> Optional[LLMResponse]:
+        """
+        Find a cached response for a similar request.
+
+        Args:
+            scope: Key from scope()
+            prompt: The decision prompt
+
+        Returns:
+            A copy of the cached LLMResponse (metadata marks the hit and
+            similarity) or None
+        """
+        if not self._entries:
+            self.stats["misses"] += 1
+            return None
+
+        embedding = await self._embed(prompt)
+        scores = self._embeddings[:len(self._entries)] @ embedding
+        fingerprint = _fingerprint(prompt)
+        now = time.monotonic()
+
+        # Best match first; fall through to the next if it's stale or unsafe
+        for index in self._np.argsort(-scores):
+            similarity = float(scores[index])
+            if similarity < self.threshold:
+                break
+
+            expires_at, entry_scope, entry_fingerprint, response = self._entries[index]
+            if now >= expires_at or entry_scope != scope:
+                continue
+            if entry_fingerprint != fingerprint:
+                self.stats["rejected"] += 1
+                continue
+
+            self.stats["hits"] += 1
+            return replace(
+                response,
+                metadata={
+                    **response.metadata,
+                    "semantic_cache_hit": True,
+                    "similarity": similarity
+                }
+            )
+
+        self.stats["misses"] += 1
+        return None
+
+    async def set(self, scope: str, prompt: str, response: LLMResponse) -> None:
+        """
+        Store a successful response.
+
+        Args:
+            scope: Key from scope()
+            prompt: The decision prompt
+            response: Response to cache (error responses are skipped)
+        """
+        if response.error:
+            return
+
+        embedding = await self._embed(prompt)
+        if self._embeddings is None:
+            self._embeddings = self._np.zeros(
+                (self.max_entries, embedding.shape[0]), dtype=embedding.dtype
+            )
+
+        entry = (
+            time.monotonic() + self.ttl_seconds,
+            scope,
+            _fingerprint(prompt),
+            response
+        )
+        slot = self._next_slot
+        self._embeddings[slot] = embedding
+        if slot < len(self._entries):
+            self._entries[slot] = entry
+        else:
+            self._entries.append(entry)
+        self._next_slot = (slot + 1) % self.max_entries
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters, rejected near-matches and hit rate."""
+        total = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "size": len(self._entries),
+            "hit_rate": self.stats["hits"] / total if total else 0.0
+        }
@@ -6,9 +6,11 @@ Exports business logic services.
 
 from .orchestrator import DecisionOrchestrator
 from .bias_detection import BiasDetectionService, get_bias_detector
+from .decision_store import DecisionStore
 
 __all__ = [
     "DecisionOrchestrator",
     "BiasDetectionService",
     "get_bias_detector",
+    "DecisionStore",
 ]
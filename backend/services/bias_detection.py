@@ -10,13 +10,87 @@ CRITICAL: This system can affect people's lives. Every line of code here
 
 import logging
 import re
-from typing import Dict, Any, List, Optional, Set
-from enum import Enum
+from typing import Dict, Any, List, Optional, Tuple
+from enum import Enum, IntFlag
 
 from models import BiasDetection
 
 logger = logging.getLogger(__name__)
 
+# Short keywords that are also parts of unrelated words ("agent", "manager",
+# "whitelist", "seniority") - matched as whole words, plurals allowed
+_WHOLE_WORD_KEYWORDS = frozenset({
+    "age", "man", "men", "male", "sex", "race", "white", "black", "gay",
+    "faith", "senior"
+})
+
+
+def _keyword_group(attr: "ProtectedAttribute", keywords: List[str]) -> str:
+    """
+    Regex group matching any keyword for one protected attribute.
+
+    Every keyword must start a word. Short ambiguous keywords must also end
+    it (plus an optional -s/-es); all others are stems that match any word
+    they begin ("younger", "handicapped", "Christianity", "religiously").
+    """
+    def alternation(words: List[str]) -> str:
+        return "|".join(map(re.escape, sorted(words, key=len, reverse=True)))
+
+    whole = [kw for kw in keywords if kw in _WHOLE_WORD_KEYWORDS]
+    stems = [kw for kw in keywords if kw not in _WHOLE_WORD_KEYWORDS]
+
+    branches = []
+    if whole:
+        branches.append(rf"\b(?:{alternation(whole)})(?:s|es)?\b")
+    if stems:
+        branches.append(rf"\b(?:{alternation(stems)})\w*")
+    return f"(?P<{attr.name}>{'|'.join(branches)})"
+
+
+# Decision types that always trigger HIGH_STAKES_DECISION
+_HIGH_STAKES_TYPES = frozenset({
+    "immigration_deportation",
+    "asylum_decision",
+    "benefit_termination",
+    "housing_denial",
+    "loan_denial",
+    "employment_termination"
+})
+
+# Deportation or life-altering decisions - human review is ALWAYS mandatory
+_CRITICAL_TYPES = frozenset({
+    "immigration_deportation",
+    "asylum_decision",
+    "benefit_termination"
+})
+
+# Decisions that could result in removal from the country
+_DEPORTATION_TYPES = frozenset({"immigration_deportation", "visa_denial"})
+
+_NO_BIAS_RECOMMENDATION = (
+    "No bias indicators detected. Decision may proceed if consensus is adequate."
+)
+
+# Fields each decision type needs - missing ones trigger INSUFFICIENT_DATA
+_FIELD_REQUIREMENTS: Dict[str, Tuple[str, ...]] = {
+    "unemployment_benefits": (
+        "employment_duration_months",
+        "termination_reason",
+        "available_for_work"
+    ),
+    "immigration_deportation": (
+        "visa_status",
+        "entry_date",
+        "criminal_record",
+        "family_ties"
+    ),
+    "loan_approval": (
+        "credit_score",
+        "income",
+        "debt_to_income_ratio"
+    )
+}
+
 
 class ProtectedAttribute(str, Enum):
     """
@@ -37,19 +111,52 @@ class ProtectedAttribute(str, Enum):
     VETERAN_STATUS = "veteran_status"
 
 
-class SafetyTrigger(str, Enum):
+# One bit per protected attribute, keyed by member name (the regex group name)
+_ATTRIBUTE_BITS: Dict[str, int] = {
+    attr.name: 1 << i for i, attr in enumerate(ProtectedAttribute)
+}
+_ALL_ATTRIBUTES_MASK = (1 << len(ProtectedAttribute)) - 1
+
+
+class SafetyTrigger(IntFlag):
     """
     Conditions that REQUIRE human review regardless of consensus.
 
     These are hard stops - the system will NOT auto-approve/deny.
+    Flags combine, so one value records every trigger that fired.
     """
-    PROTECTED_ATTRIBUTE_MENTIONED = "protected_attribute_mentioned"
-    LOW_CONFIDENCE_CONSENSUS = "low_confidence_consensus"
-    HIGH_STAKES_DECISION = "high_stakes_decision"
-    CONFLICTING_REASONING = "conflicting_reasoning"
-    INSUFFICIENT_DATA = "insufficient_data"
-    DEPORTATION_RISK = "deportation_risk"
-    BENEFIT_TERMINATION = "benefit_termination"
+    PROTECTED_ATTRIBUTE_MENTIONED = 1
+    LOW_CONFIDENCE_CONSENSUS = 2
+    HIGH_STAKES_DECISION = 4
+    CONFLICTING_REASONING = 8
+    INSUFFICIENT_DATA = 16
+    DEPORTATION_RISK = 32
+    BENEFIT_TERMINATION = 64
+
+
+# Recommendation text per safety trigger, in the order it is reported
+_RECOMMENDATIONS: Tuple[Tuple[SafetyTrigger, str], ...] = (
+    (
+        SafetyTrigger.PROTECTED_ATTRIBUTE_MENTIONED,
+        "CRITICAL: Protected attributes mentioned ({attributes}). "
+        "Verify decision is not based on discriminatory factors."
+    ),
+    (
+        SafetyTrigger.LOW_CONFIDENCE_CONSENSUS,
+        "Models show low confidence ({confidence:.0%}). "
+        "Review case for missing information or ambiguity."
+    ),
+    (
+        SafetyTrigger.HIGH_STAKES_DECISION,
+        "High-stakes decision with significant impact on applicant. "
+        "Ensure thorough review of all factors."
+    ),
+    (
+        SafetyTrigger.DEPORTATION_RISK,
+        "DEPORTATION RISK: This decision could result in removal from country. "
+        "Mandatory legal review and applicant notification required."
+    )
+)
 
 
 class BiasDetectionService:
@@ -63,30 +170,32 @@ class BiasDetectionService:
     # Keywords that indicate protected attributes being discussed
     PROTECTED_KEYWORDS = {
         ProtectedAttribute.RACE: [
-            "race", "racial", "black", "white", "asian", "hispanic",
+            "race", "racial", "racially", "black", "white", "asian", "hispanic",
             "latino", "latina", "african american", "caucasian"
         ],
         ProtectedAttribute.ETHNICITY: [
-            "ethnicity", "ethnic", "minority", "cultural background"
+            "ethnicity", "ethnicities", "ethnic", "ethnically", "minority",
+            "minorities", "cultural background"
         ],
         ProtectedAttribute.NATIONAL_ORIGIN: [
-            "country of origin", "nationality", "immigrant", "foreign",
+            "country of origin", "nationality", "nationalities", "immigrant",
+            "foreign", "foreigner",
             "native-born", "birthplace", "citizen", "citizenship"
         ],
         ProtectedAttribute.GENDER: [
-            "gender", "male", "female", "man", "woman", "sex",
+            "gender", "male", "female", "man", "men", "woman", "women", "sex",
             "transgender", "non-binary"
         ],
         ProtectedAttribute.AGE: [
-            "age", "elderly", "senior", "young", "older worker",
+            "age", "aged", "aging", "ageing", "elderly", "senior", "young", "older worker",
             "retirement age", "generational"
         ],
         ProtectedAttribute.RELIGION: [
-            "religion", "religious", "christian", "muslim", "jewish",
+            "religio", "christian", "muslim", "jewish",
             "hindu", "buddhist", "atheist", "faith"
         ],
         ProtectedAttribute.DISABILITY: [
-            "disability", "disabled", "handicap", "impairment",
+            "disab", "handicap", "impairment",
             "medical condition", "accommodation"
         ],
         ProtectedAttribute.SEXUAL_ORIENTATION: [
@@ -94,14 +203,25 @@ class BiasDetectionService:
             "lgbtq", "homosexual", "heterosexual"
         ],
         ProtectedAttribute.PREGNANCY: [
-            "pregnancy", "pregnant", "maternity", "childbirth",
+            "pregnan", "maternity", "childbirth",
             "expecting", "parental leave"
         ],
         ProtectedAttribute.VETERAN_STATUS: [
-            "veteran", "military service", "armed forces", "discharge"
+            "veteran", "military service", "armed forces", "discharge",
+            "discharged"
         ]
     }
 
+    # All keywords in one case-insensitive pattern, one named group per
+    # attribute (see _keyword_group for how each keyword is anchored)
+    _KEYWORDS_RE = re.compile(
+        "|".join(
+            _keyword_group(attr, keywords)
+            for attr, keywords in PROTECTED_KEYWORDS.items()
+        ),
+        re.IGNORECASE
+    )
+
     def __init__(
         self,
         strict_mode: bool = True,
@@ -111,7 +231,8 @@ class BiasDetectionService:
         Initialize bias detection service.
 
         Args:
-            strict_mode: If True, flag ANY mention of protected attributes
+            strict_mode: If True, flag ANY mention of protected attributes;
+                if False, only scan high-stakes decision types
             confidence_threshold: Minimum confidence to auto-decide (0.7 = 70%)
         """
         self.strict_mode = strict_mode
@@ -148,27 +269,43 @@ class BiasDetectionService:
         Returns:
             BiasDetection object with safety recommendations
         """
-        logger.info(f"🔍 Running bias detection for {decision_type}...")
+        logger.info("🔍 Running bias detection for %s...", decision_type)
 
-        detected_attributes: Set[str] = set()
-        safety_triggers: List[SafetyTrigger] = []
+        safety_triggers = SafetyTrigger(0)
 
         # CHECK 1: Scan reasoning for protected attributes
-        logger.debug("Checking for protected attribute mentions...")
-        for model_decision in model_decisions:
-            reasoning = model_decision.reasoning.lower()
-
-            for attr, keywords in self.PROTECTED_KEYWORDS.items():
-                for keyword in keywords:
-                    if keyword in reasoning:
-                        detected_attributes.add(attr.value)
-                        safety_triggers.append(
-                            SafetyTrigger.PROTECTED_ATTRIBUTE_MENTIONED
-                        )
-                        logger.warning(
-                            f"⚠️  Protected attribute detected: {attr.value} "
-                            f"(keyword: '{keyword}') in {model_decision.model_provider}"
-                        )
+        # Outside strict mode only high-stakes decisions are scanned
+        scan_reasoning = self.strict_mode or decision_type in _HIGH_STAKES_TYPES
+        if scan_reasoning:
+            logger.debug("Checking for protected attribute mentions...")
+        detected_mask = 0
+        for model_decision in model_decisions if scan_reasoning else ():
+            model_mask = 0
+
+            for match in self._KEYWORDS_RE.finditer(model_decision.reasoning):
+                bit = _ATTRIBUTE_BITS[match.lastgroup]
+                if model_mask & bit:
+                    continue  # Already reported for this model
+
+                model_mask |= bit
+                if logger.isEnabledFor(logging.WARNING):
+                    logger.warning(
+                        "⚠️  Protected attribute detected: %s (keyword: %r) in %s",
+                        ProtectedAttribute[match.lastgroup].value,
+                        match.group(),
+                        model_decision.model_provider
+                    )
+                if model_mask == _ALL_ATTRIBUTES_MASK:
+                    break  # Nothing left to find in this reasoning
+
+            detected_mask |= model_mask
+
+        if detected_mask:
+            safety_triggers |= SafetyTrigger.PROTECTED_ATTRIBUTE_MENTIONED
+        detected_attributes = [
+            attr.value for attr in ProtectedAttribute
+            if detected_mask & _ATTRIBUTE_BITS[attr.name]
+        ]
 
         # CHECK 2: Low confidence consensus
         logger.debug("Checking confidence levels...")
@@ -176,33 +313,25 @@ class BiasDetectionService:
         avg_confidence = sum(confidences) / len(confidences)
 
         if avg_confidence < self.confidence_threshold:
-            safety_triggers.append(SafetyTrigger.LOW_CONFIDENCE_CONSENSUS)
+            safety_triggers |= SafetyTrigger.LOW_CONFIDENCE_CONSENSUS
             logger.warning(
-                f"⚠️  Low confidence: {avg_confidence:.0%} < {self.confidence_threshold:.0%}"
+                "⚠️  Low confidence: %.0f%% < %.0f%%",
+                avg_confidence * 100, self.confidence_threshold * 100
             )
 
         # CHECK 3: High-stakes decision types
-        high_stakes_types = [
-            "immigration_deportation",
-            "asylum_decision",
-            "benefit_termination",
-            "housing_denial",
-            "loan_denial",
-            "employment_termination"
-        ]
-
-        if decision_type in high_stakes_types:
-            safety_triggers.append(SafetyTrigger.HIGH_STAKES_DECISION)
-            logger.warning(f"⚠️  High-stakes decision type: {decision_type}")
+        if decision_type in _HIGH_STAKES_TYPES:
+            safety_triggers |= SafetyTrigger.HIGH_STAKES_DECISION
+            logger.warning("⚠️  High-stakes decision type: %s", decision_type)
 
         # CHECK 4: Conflicting reasoning (models agree on decision but for different reasons)
         if consensus_analysis.agreement_level == 1.0:  # All agree on decision
             # But check if reasoning varies significantly
             if consensus_analysis.confidence_variance > 0.1:
-                safety_triggers.append(SafetyTrigger.CONFLICTING_REASONING)
+                safety_triggers |= SafetyTrigger.CONFLICTING_REASONING
                 logger.warning(
-                    f"⚠️  High confidence variance despite consensus: "
-                    f"{consensus_analysis.confidence_variance:.4f}"
+                    "⚠️  High confidence variance despite consensus: %.4f",
+                    consensus_analysis.confidence_variance
                 )
 
         # CHECK 5: Insufficient data
@@ -210,39 +339,40 @@ class BiasDetectionService:
         missing_fields = [f for f in required_fields if f not in input_data]
 
         if missing_fields:
-            safety_triggers.append(SafetyTrigger.INSUFFICIENT_DATA)
-            logger.warning(f"⚠️  Missing required fields: {missing_fields}")
+            safety_triggers |= SafetyTrigger.INSUFFICIENT_DATA
+            logger.warning("⚠️  Missing required fields: %s", missing_fields)
 
         # CHECK 6: Deportation risk (CRITICAL)
-        if decision_type in ["immigration_deportation", "visa_denial"]:
-            safety_triggers.append(SafetyTrigger.DEPORTATION_RISK)
+        if decision_type in _DEPORTATION_TYPES:
+            safety_triggers |= SafetyTrigger.DEPORTATION_RISK
             logger.critical(
                 "🚨 DEPORTATION RISK - Mandatory human review required"
             )
 
         # Determine if bias was detected
-        bias_detected = len(detected_attributes) > 0 or len(safety_triggers) > 0
+        bias_detected = bool(detected_attributes or safety_triggers)
 
         # Generate recommendation
         recommendation = self._generate_recommendation(
-            bias_detected,
             detected_attributes,
             safety_triggers,
             avg_confidence
-        )
+        ) if bias_detected else _NO_BIAS_RECOMMENDATION
 
-        bias_analysis = BiasDetection(
+        # Every field is built here from already-validated ModelDecisions
+        # (confidences in [0, 1]), so skip Pydantic re-validation
+        bias_analysis = BiasDetection.model_construct(
             bias_detected=bias_detected,
             bias_type=self._categorize_bias(detected_attributes, safety_triggers),
-            affected_attributes=list(detected_attributes),
+            affected_attributes=detected_attributes,
             confidence=1.0 - avg_confidence if bias_detected else avg_confidence,
             recommendation=recommendation
         )
 
         if bias_detected:
             logger.warning(
-                f"⚠️  Bias detection result: {len(detected_attributes)} protected "
-                f"attributes, {len(safety_triggers)} safety triggers"
+                "⚠️  Bias detection result: %d protected attributes, %d safety triggers",
+                len(detected_attributes), len(safety_triggers)
             )
         else:
             logger.info("✓ No bias indicators detected")
@@ -278,12 +408,7 @@ class BiasDetectionService:
             return True
 
         # RULE 2: Deportation or life-altering decisions = ALWAYS review
-        critical_types = [
-            "immigration_deportation",
-            "asylum_decision",
-            "benefit_termination"
-        ]
-        if decision_type in critical_types:
+        if decision_type in _CRITICAL_TYPES:
             logger.critical(
                 f"🚨 MANDATORY REVIEW: Critical decision type - {decision_type}"
             )
@@ -306,37 +431,18 @@ class BiasDetectionService:
 
         return False
 
-    def _get_required_fields(self, decision_type: str) -> List[str]:
+    def _get_required_fields(self, decision_type: str) -> Tuple[str, ...]:
         """
         Get required fields for each decision type.
 
         Missing required fields = insufficient data = flag for review.
         """
-        field_requirements = {
-            "unemployment_benefits": [
-                "employment_duration_months",
-                "termination_reason",
-                "available_for_work"
-            ],
-            "immigration_deportation": [
-                "visa_status",
-                "entry_date",
-                "criminal_record",
-                "family_ties"
-            ],
-            "loan_approval": [
-                "credit_score",
-                "income",
-                "debt_to_income_ratio"
-            ]
-        }
-
-        return field_requirements.get(decision_type, [])
+        return _FIELD_REQUIREMENTS.get(decision_type, ())
 
     def _categorize_bias(
         self,
-        detected_attributes: Set[str],
-        safety_triggers: List[SafetyTrigger]
+        detected_attributes: List[str],
+        safety_triggers: SafetyTrigger
     ) -> Optional[str]:
         """Categorize the type of bias detected."""
         if not detected_attributes and not safety_triggers:
@@ -355,42 +461,17 @@ class BiasDetectionService:
 
     def _generate_recommendation(
         self,
-        bias_detected: bool,
-        detected_attributes: Set[str],
-        safety_triggers: List[SafetyTrigger],
+        detected_attributes: List[str],
+        safety_triggers: SafetyTrigger,
         avg_confidence: float
     ) -> str:
-        """Generate human-readable safety recommendation."""
-        if not bias_detected:
-            return "No bias indicators detected. Decision may proceed if consensus is adequate."
-
-        recommendations = []
-
-        if detected_attributes:
-            recommendations.append(
-                f"CRITICAL: Protected attributes mentioned ({', '.join(detected_attributes)}). "
-                f"Verify decision is not based on discriminatory factors."
-            )
-
-        if SafetyTrigger.LOW_CONFIDENCE_CONSENSUS in safety_triggers:
-            recommendations.append(
-                f"Models show low confidence ({avg_confidence:.0%}). "
-                f"Review case for missing information or ambiguity."
-            )
-
-        if SafetyTrigger.HIGH_STAKES_DECISION in safety_triggers:
-            recommendations.append(
-                "High-stakes decision with significant impact on applicant. "
-                "Ensure thorough review of all factors."
-            )
-
-        if SafetyTrigger.DEPORTATION_RISK in safety_triggers:
-            recommendations.append(
-                "DEPORTATION RISK: This decision could result in removal from country. "
-                "Mandatory legal review and applicant notification required."
-            )
-
-        return " ".join(recommendations)
+        """Generate human-readable safety recommendation (bias detected)."""
+        attributes = ", ".join(detected_attributes)
+        return " ".join(
+            template.format(attributes=attributes, confidence=avg_confidence)
+            for trigger, template in _RECOMMENDATIONS
+            if trigger in safety_triggers
+        )
 
 
 # Singleton instance for global access
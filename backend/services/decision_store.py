@@ -0,0 +1,201 @@
+"""
+Decision Store for TrustChain.
+
+Bounded in-memory storage for decisions made by the API. Stands in for
+the database layer (see database/schema.sql) until it is wired in.
+"""
+
+import heapq
+import logging
+from collections import OrderedDict, defaultdict, deque
+from typing import Any, Callable, DefaultDict, Deque, List, Optional, Set
+
+from cachetools import Cache, TTLCache
+
+from models import Decision
+
+logger = logging.getLogger(__name__)
+
+
+class _NotifyingTTLCache(TTLCache):
+    """
+    TTLCache that calls on_remove(key, value) when an entry is evicted
+    (LRU, to make room) or expires.
+
+    TTLCache.expire() drops entries without going through overridable
+    hooks, so keys are also tracked in the order they were last set. With
+    one TTL for every entry that is also expiry order, so after expire()
+    the removed keys are exactly the leading keys that are gone.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        on_remove: Callable[[Any, Any], None]
+    ):
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self._on_remove = on_remove
+        self._set_order: OrderedDict = OrderedDict()
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._set_order[key] = value
+        self._set_order.move_to_end(key)
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._set_order.pop(key, None)
+
+    def popitem(self):
+        key, value = super().popitem()
+        self._on_remove(key, value)
+        return key, value
+
+    def expire(self, time=None):
+        super().expire(time)
+        while self._set_order:
+            key = next(iter(self._set_order))
+            if Cache.__contains__(self, key):  # Still stored (expired or not)
+                break
+            self._on_remove(key, self._set_order.pop(key))
+
+
+class DecisionStore:
+    """
+    Size-bounded, TTL-expiring store for decisions.
+
+    Replaces the plain dict the API used to keep decisions in, which grew
+    forever. Once max_size is reached the least recently used decision is
+    evicted, and every decision expires ttl_seconds after it was stored.
+
+    A parallel deque of decision IDs (newest last) lets listing walk only
+    as many entries as it returns instead of materializing every value.
+    Secondary indexes (status -> IDs, decision type -> IDs) are kept so
+    filtered listings only look at decisions that can match. Decisions
+    are removed from them as soon as they are evicted or expire, and
+    empty index entries are dropped, so the indexes share the size bound.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 10_000,
+        ttl_seconds: float = 86400
+    ):
+        """
+        Initialize the decision store.
+
+        Args:
+            max_size: Maximum number of decisions kept in memory
+            ttl_seconds: Seconds a decision is kept before it expires (default 24h)
+        """
+        self._decisions: TTLCache = _NotifyingTTLCache(
+            maxsize=max_size,
+            ttl=ttl_seconds,
+            on_remove=lambda _, decision: self._unindex(decision)
+        )
+        self._recent: Deque[str] = deque(maxlen=max_size)
+
+        # Secondary indexes, kept in step with evictions and expiry
+        self._by_status: DefaultDict[str, Set[str]] = defaultdict(set)
+        self._by_type: DefaultDict[str, Set[str]] = defaultdict(set)
+
+        logger.info(
+            f"Decision store initialized - max size: {max_size}, TTL: {ttl_seconds}s"
+        )
+
+    def add(self, decision: Decision) -> None:
+        """Store a decision, evicting the least recently used one if full."""
+        previous = self._decisions.get(decision.decision_id)
+        if previous is not None:
+            self._unindex(previous)
+
+        self._decisions[decision.decision_id] = decision
+        self._recent.append(decision.decision_id)
+        self._by_status[decision.status.value].add(decision.decision_id)
+        self._by_type[decision.decision_type].add(decision.decision_id)
+
+    def get(self, decision_id: str) -> Optional[Decision]:
+        """Get a decision by ID, or None if unknown, evicted or expired."""
+        return self._decisions.get(decision_id)
+
+    def query(
+        self,
+        status: Optional[str] = None,
+        decision_type: Optional[str] = None,
+        limit: int = 100
+    ) -> List[Decision]:
+        """
+        List the most recent decisions, newest first.
+
+        Args:
+            status: Only include decisions with this status value
+            decision_type: Only include decisions of this type
+            limit: Maximum number of decisions to return
+
+        Returns:
+            Up to `limit` matching decisions
+        """
+        if status or decision_type:
+            return self._query_indexed(status, decision_type, limit)
+
+        results: List[Decision] = []
+        seen = set()
+
+        for decision_id in reversed(self._recent):
+            if len(results) >= limit:
+                break
+            if decision_id in seen:
+                continue
+            seen.add(decision_id)
+
+            decision = self._decisions.get(decision_id)
+            if decision is not None:  # Skip evicted or expired
+                results.append(decision)
+
+        return results
+
+    def _query_indexed(
+        self,
+        status: Optional[str],
+        decision_type: Optional[str],
+        limit: int
+    ) -> List[Decision]:
+        """Filtered listing via the status/type indexes (intersected if both given)."""
+        self._decisions.expire()  # Unindex anything that has expired
+
+        candidates: Optional[Set[str]] = None
+        for index, key in ((self._by_status, status), (self._by_type, decision_type)):
+            if not key:
+                continue
+            ids = index.get(key, set())
+            candidates = ids if candidates is None else candidates & ids
+
+        decisions = []
+        for decision_id in candidates or ():
+            decision = self._decisions.get(decision_id)
+            if decision is not None:  # May expire between expire() and here
+                decisions.append(decision)
+
+        # Newest first, to match unfiltered listing
+        return heapq.nlargest(limit, decisions, key=lambda d: d.created_at)
+
+    def _unindex(self, decision: Decision) -> None:
+        """Remove a decision from the secondary indexes, dropping empty entries."""
+        for index, key in (
+            (self._by_status, decision.status.value),
+            (self._by_type, decision.decision_type)
+        ):
+            ids = index.get(key)
+            if ids is None:
+                continue
+            ids.discard(decision.decision_id)
+            if not ids:
+                del index[key]
+
+    def __contains__(self, decision_id: str) -> bool:
+        return decision_id in self._decisions
+
+    def __len__(self) -> int:
+        self._decisions.expire()
+        return len(self._decisions)
@@ -15,9 +15,6 @@ from datetime import datetime
 
 from providers import (
     BaseLLMProvider,
-    AnthropicProvider,
-    OpenAIProvider,
-    LlamaProvider,
     ProviderConfig,
     LLMResponse,
     ModelProvider
@@ -65,16 +62,20 @@ class DecisionOrchestrator:
         self.providers: List[BaseLLMProvider] = []
         self.consensus_threshold = require_consensus_threshold
 
-        # Initialize providers that have configurations
+        # Initialize providers that have configurations (each provider's SDK
+        # is only imported if that provider is configured)
         if anthropic_config:
+            from providers import AnthropicProvider
             self.providers.append(AnthropicProvider(config=anthropic_config))
             logger.info("✓ Anthropic provider initialized")
 
         if openai_config:
+            from providers import OpenAIProvider
             self.providers.append(OpenAIProvider(config=openai_config))
             logger.info("✓ OpenAI provider initialized")
 
         if llama_config:
+            from providers import LlamaProvider
             self.providers.append(LlamaProvider(config=llama_config))
             logger.info("✓ Llama provider initialized")
 
@@ -193,8 +194,10 @@ class DecisionOrchestrator:
             )
 
         # STEP 6: Generate audit hash for tamper detection
+        # Serializing + hashing long reasoning strings is CPU-bound, so run it
+        # in a worker thread instead of blocking the event loop
         decision.completed_at = datetime.now()
-        decision.audit_hash = decision.calculate_audit_hash()
+        decision.audit_hash = await asyncio.to_thread(decision.calculate_audit_hash)
 
         logger.info(f"✅ Decision complete: {decision.decision_id}")
         return decision
@@ -463,6 +466,15 @@ class DecisionOrchestrator:
 
         return consensus
 
+    async def prewarm(self) -> None:
+        """Warm up all providers concurrently (call on application startup)."""
+        await asyncio.gather(*(provider.prewarm() for provider in self.providers))
+
+    async def close(self) -> None:
+        """Close provider connections (call on application shutdown)."""
+        for provider in self.providers:
+            await provider.close()
+
     def get_provider_health(self) -> Dict[str, Any]:
         """
         Get health status of all providers.
@@ -124,7 +124,7 @@ def get_decision(decision_id: str) -> Dict[str, Any]:
     print(f"📥 Retrieving Decision: {decision_id}")
     print("="*80)
 
-    response = requests.get(f"{API_V1}/decisions/{decision_id}")
+    response = requests.get(f"{API_V1}/decisions/{decision_id}", params={"verify": "true"})
 
     if response.status_code == 200:
         data = response.json()
@@ -3,7 +3,9 @@ Pytest configuration and fixtures for TrustChain tests
 """
 import os
 import pytest
+from datetime import datetime
 from dotenv import load_dotenv
+from providers.base import LLMResponse, ModelProvider
 
 # Load environment variables
 load_dotenv()
@@ -141,6 +143,26 @@ def low_consensus_case():
     }
 
 
+@pytest.fixture
+def llm_response():
+    """Factory for minimal successful LLMResponses; keyword args override fields"""
+    def make(**overrides):
+        fields = dict(
+            provider=ModelProvider.ANTHROPIC,
+            model_name="claude-3-haiku-20240307",
+            content="APPROVE",
+            reasoning="Meets all criteria",
+            confidence=0.9,
+            timestamp=datetime.now(),
+            metadata={"stop_reason": "end_turn"},
+            tokens_used=42
+        )
+        fields.update(overrides)
+        return LLMResponse(**fields)
+
+    return make
+
+
 # Mark slow tests (requiring API calls)
 def pytest_configure(config):
     config.addinivalue_line(
@@ -0,0 +1,82 @@
+"""
+Unit tests for protected-attribute detection in BiasDetectionService
+"""
+import pytest
+from models.decision import ConsensusAnalysis, DecisionOutcome, ModelDecision
+from services.bias_detection import BiasDetectionService
+
+
+def make_model_decision(reasoning, confidence=0.9):
+    """Build a minimal ModelDecision with the given reasoning"""
+    return ModelDecision(
+        model_provider="anthropic",
+        model_name="claude-3-haiku-20240307",
+        decision=DecisionOutcome.APPROVED,
+        reasoning=reasoning,
+        confidence=confidence
+    )
+
+
+class TestProtectedAttributeDetection:
+    """Test suite for the protected-keyword scan (CHECK 1)"""
+
+    @pytest.fixture
+    def detector(self):
+        """Create a BiasDetectionService instance"""
+        return BiasDetectionService()
+
+    @pytest.fixture
+    def consensus(self):
+        """Unanimous, low-variance consensus so only CHECK 1 can fire"""
+        return ConsensusAnalysis(
+            agreement_level=1.0,
+            majority_decision=DecisionOutcome.APPROVED,
+            confidence_variance=0.0
+        )
+
+    def detect(self, detector, consensus, reasoning):
+        """Run analyze_decision and return the affected attributes"""
+        result = detector.analyze_decision(
+            [make_model_decision(reasoning)],
+            consensus,
+            "general",
+            {}
+        )
+        return result.affected_attributes
+
+    @pytest.mark.parametrize("reasoning, attribute", [
+        ("Applies to other immigrants in the region.", "national_origin"),
+        ("Veterans receive priority processing.", "veteran_status"),
+        ("The Muslims in the program were reviewed.", "religion"),
+        ("Benefits for citizens of the state.", "national_origin"),
+        ("The applicant reports several disabilities.", "disability"),
+        ("Minorities are underrepresented here.", "ethnicity"),
+        ("Women were hired at the same rate.", "gender"),
+        ("The applicant is Black and has good credit.", "race"),
+        ("A younger applicant was preferred.", "age"),
+        ("The youngest candidate was selected.", "age"),
+        ("An ageing workforce was cited.", "age"),
+        ("The applicant is handicapped.", "disability"),
+        ("Homosexuality was mentioned in the file.", "sexual_orientation"),
+        ("Heterosexuality was assumed.", "sexual_orientation"),
+        ("The applicant practices Christianity.", "religion"),
+        ("The applicant is religiously observant.", "religion"),
+    ])
+    def test_keyword_forms_detected(self, detector, consensus, reasoning, attribute):
+        """Plurals, derived forms and capitalized keywords are flagged"""
+        assert attribute in self.detect(detector, consensus, reasoning)
+
+    @pytest.mark.parametrize("reasoning", [
+        "The manager confirmed the layoff.",
+        "An agent verified the employment records.",
+        "Seniority was not considered; the email was whitelisted.",
+        "Income is stable and debts are low.",
+    ])
+    def test_keywords_inside_other_words_ignored(self, detector, consensus, reasoning):
+        """Keywords embedded in unrelated words are not flagged"""
+        assert self.detect(detector, consensus, reasoning) == []
+
+    def test_attribute_reported_once(self, detector, consensus):
+        """Repeated mentions report the attribute once, in enum order"""
+        reasoning = "The veteran is female. Veterans and women qualify."
+        assert self.detect(detector, consensus, reasoning) == ["gender", "veteran_status"]
@@ -0,0 +1,61 @@
+"""
+Unit tests for decision request validation and audit hashing
+"""
+import pytest
+from pydantic import ValidationError
+from models.decision import Decision, DecisionRequest
+
+
+def make_request(input_data):
+    """Build a DecisionRequest with the given input data"""
+    return DecisionRequest(
+        case_id="case_1",
+        decision_type="loan_approval",
+        input_data=input_data,
+        policy_context="test policy"
+    )
+
+
+def deeply_nested(depth):
+    """Build a dict nested depth levels deep"""
+    value = {}
+    for _ in range(depth):
+        value = {"nested": value}
+    return value
+
+
+class TestDecisionRequest:
+    """Test suite for DecisionRequest validation"""
+
+    @pytest.mark.parametrize("input_data", [
+        {"income": 10 ** 20},
+        {"history": [{"amount": -(2 ** 64)}]},
+    ])
+    def test_out_of_range_integers_rejected(self, input_data):
+        """Integers the audit hash cannot serialize fail validation"""
+        with pytest.raises(ValidationError):
+            make_request(input_data)
+
+    @pytest.mark.parametrize("input_data", [
+        {"name": "\ud800"},
+        deeply_nested(300),
+        {"income": float("nan")},
+        {"scores": [1.0, float("-inf")]},
+    ])
+    def test_unserializable_input_rejected(self, input_data):
+        """Surrogates, deep nesting and non-finite floats fail validation"""
+        with pytest.raises(ValidationError):
+            make_request(input_data)
+
+    def test_64_bit_integers_hashable(self):
+        """Integers at the edge of the accepted range can be audit-hashed"""
+        request = make_request({"income": 2 ** 64 - 1, "debt": -(2 ** 63)})
+        decision = Decision(
+            decision_id="dec_1",
+            case_id=request.case_id,
+            decision_type=request.decision_type,
+            input_data=request.input_data,
+            policy_context=request.policy_context
+        )
+
+        assert len(decision.calculate_audit_hash()) == 64
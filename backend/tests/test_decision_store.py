@@ -0,0 +1,118 @@
+"""
+Unit tests for the in-memory decision store
+"""
+import time
+import pytest
+from models.decision import Decision, DecisionStatus
+from services.decision_store import DecisionStore
+
+
+def make_decision(decision_id, status=DecisionStatus.COMPLETED, decision_type="unemployment_benefits"):
+    """Build a minimal Decision for store tests"""
+    return Decision(
+        decision_id=decision_id,
+        case_id=f"case_{decision_id}",
+        decision_type=decision_type,
+        input_data={},
+        policy_context="test policy",
+        status=status
+    )
+
+
+class TestDecisionStore:
+    """Test suite for DecisionStore class"""
+
+    @pytest.fixture
+    def store(self):
+        """Create a small DecisionStore instance"""
+        return DecisionStore(max_size=3, ttl_seconds=60)
+
+    def test_add_and_get(self, store):
+        """Test that stored decisions can be retrieved by ID"""
+        decision = make_decision("dec_1")
+        store.add(decision)
+
+        assert store.get("dec_1") is decision
+        assert "dec_1" in store
+        assert len(store) == 1
+
+    def test_get_unknown_returns_none(self, store):
+        """Test that unknown IDs return None instead of raising"""
+        assert store.get("missing") is None
+        assert "missing" not in store
+
+    def test_evicts_when_full(self, store):
+        """Test that the store never grows past max_size"""
+        for i in range(5):
+            store.add(make_decision(f"dec_{i}"))
+
+        assert len(store) == 3
+        assert store.get("dec_0") is None
+        assert store.get("dec_4") is not None
+
+    def test_query_returns_newest_first(self, store):
+        """Test that listing returns the most recent decisions first"""
+        for i in range(3):
+            store.add(make_decision(f"dec_{i}"))
+
+        ids = [d.decision_id for d in store.query(limit=2)]
+
+        assert ids == ["dec_2", "dec_1"]
+
+    def test_query_filters(self, store):
+        """Test filtering by status and decision type"""
+        store.add(make_decision("dec_1", status=DecisionStatus.COMPLETED))
+        store.add(make_decision("dec_2", status=DecisionStatus.REQUIRES_REVIEW))
+        store.add(make_decision("dec_3", decision_type="loan_approval"))
+
+        review = store.query(status="requires_review")
+        loans = store.query(decision_type="loan_approval")
+
+        assert [d.decision_id for d in review] == ["dec_2"]
+        assert [d.decision_id for d in loans] == ["dec_3"]
+
+    def test_query_skips_duplicate_ids(self, store):
+        """Test that re-storing a decision does not list it twice"""
+        store.add(make_decision("dec_1"))
+        store.add(make_decision("dec_1"))
+
+        assert len(store.query()) == 1
+
+    def test_query_filters_combined(self, store):
+        """Test that status and type filters intersect"""
+        store.add(make_decision("dec_1", status=DecisionStatus.REQUIRES_REVIEW))
+        store.add(make_decision("dec_2", status=DecisionStatus.REQUIRES_REVIEW, decision_type="loan_approval"))
+        store.add(make_decision("dec_3", decision_type="loan_approval"))
+
+        results = store.query(status="requires_review", decision_type="loan_approval")
+
+        assert [d.decision_id for d in results] == ["dec_2"]
+
+    def test_query_filters_skip_evicted(self, store):
+        """Test that indexed IDs of evicted decisions are not returned"""
+        for i in range(5):
+            store.add(make_decision(f"dec_{i}", status=DecisionStatus.REQUIRES_REVIEW))
+
+        ids = {d.decision_id for d in store.query(status="requires_review")}
+
+        assert ids == {"dec_2", "dec_3", "dec_4"}
+
+    def test_indexes_drop_evicted(self, store):
+        """Test that evicted decisions leave no index entries behind"""
+        for i in range(5):
+            store.add(make_decision(f"dec_{i}", decision_type=f"type_{i}"))
+
+        assert set(store._by_type) == {"type_2", "type_3", "type_4"}
+        assert store._by_status["completed"] == {"dec_2", "dec_3", "dec_4"}
+
+    def test_indexes_drop_expired(self):
+        """Test that expired decisions are removed from the indexes"""
+        store = DecisionStore(max_size=3, ttl_seconds=0.05)
+        store.add(make_decision("dec_1"))
+        store.add(make_decision("dec_2", decision_type="loan_approval"))
+
+        time.sleep(0.1)
+
+        assert len(store) == 0
+        assert not store._by_status
+        assert not store._by_type
@@ -0,0 +1,67 @@
+"""
+Unit tests for Ollama stream handling in LlamaProvider
+"""
+import pytest
+from types import SimpleNamespace
+from providers.base import ProviderConfig, ProviderException
+from providers.llama_provider import LlamaProvider
+
+
+class FakeResponse:
+    """aiohttp response stub that streams the given JSON lines"""
+
+    def __init__(self, lines):
+        self.status = 200
+        self.content = self.iter_lines(lines)
+
+    async def iter_lines(self, lines):
+        for line in lines:
+            yield line
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        pass
+
+
+def make_provider(lines):
+    """Build a LlamaProvider whose session streams the given lines"""
+    provider = LlamaProvider(ProviderConfig())
+    session = SimpleNamespace(post=lambda *args, **kwargs: FakeResponse(lines))
+
+    async def get_session():
+        return session
+
+    provider._get_session = get_session
+    return provider
+
+
+class TestStreamChunks:
+    """Test suite for _make_api_call over a streamed Ollama response"""
+
+    @pytest.mark.asyncio
+    async def test_complete_stream_succeeds(self):
+        """Test that a stream ending with a done chunk yields the full text"""
+        provider = make_provider([
+            b'{"response": "APPROVE"}\n',
+            b'{"response": "", "done": true, "eval_count": 1}\n'
+        ])
+
+        response = await provider._make_api_call("case")
+
+        assert response.content == "APPROVE"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("lines", [
+        [b'{"response": "APP"}\n', b'{"error": "model runner crashed"}\n'],
+        [b'{"response": "APP"}\n'],
+    ])
+    async def test_failed_stream_is_recoverable_error(self, lines):
+        """Test that error lines and truncated streams are not returned as decisions"""
+        provider = make_provider(lines)
+
+        with pytest.raises(ProviderException) as exc_info:
+            await provider._make_api_call("case")
+
+        assert exc_info.value.recoverable
@@ -0,0 +1,199 @@
+"""
+Unit tests for the LLM response cache
+"""
+import asyncio
+import pytest
+from providers.base import BaseLLMProvider, ModelProvider, ProviderConfig
+from providers.cache import LLMCache, InMemoryCacheBackend
+
+
+class TestLLMCache:
+    """Test suite for LLMCache class"""
+
+    @pytest.fixture
+    def cache(self):
+        """Create an LLMCache with the in-memory backend"""
+        return LLMCache(backend=InMemoryCacheBackend(max_size=10), ttl_seconds=60)
+
+    def test_cache_key_is_deterministic(self):
+        """Test that identical requests produce identical keys"""
+        messages = [{"role": "user", "content": "case details"}]
+
+        key_1 = LLMCache.cache_key("anthropic", "model", messages, 0.0, 100)
+        key_2 = LLMCache.cache_key("anthropic", "model", list(messages), 0.0, 100)
+        key_3 = LLMCache.cache_key("openai", "model", messages, 0.0, 100)
+
+        assert key_1 == key_2
+        assert key_1 != key_3
+
+    def test_only_deterministic_requests_cacheable(self):
+        """Test that sampled (temperature > 0) requests are not cached"""
+        assert LLMCache.is_cacheable(0)
+        assert LLMCache.is_cacheable(0.005)
+        assert not LLMCache.is_cacheable(0.7)
+
+    @pytest.mark.asyncio
+    async def test_set_and_get_round_trip(self, cache, llm_response):
+        """Test that cached responses are rehydrated and marked as hits"""
+        response = llm_response()
+        await cache.set("key", response)
+
+        cached = await cache.get("key")
+
+        assert cached.content == response.content
+        assert cached.provider == ModelProvider.ANTHROPIC
+        assert cached.timestamp == response.timestamp
+        assert cached.metadata["cache_hit"] is True
+        assert cache.get_stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_error_responses_not_cached(self, cache, llm_response):
+        """Test that failed responses are never served from cache"""
+        await cache.set("key", llm_response(error="timeout"))
+
+        assert await cache.get("key") is None
+        assert cache.get_stats()["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_misses(self, llm_response):
+        """Test that entries past their TTL are not returned"""
+        cache = LLMCache(ttl_seconds=0)
+        await cache.set("key", llm_response())
+
+        assert await cache.get("key") is None
+
+    @pytest.mark.asyncio
+    async def test_backend_errors_fail_open(self, llm_response):
+        """Test that a failing backend behaves like an empty cache"""
+        cache = LLMCache(backend=BrokenBackend())
+
+        await cache.set("key", llm_response())
+
+        assert await cache.get("key") is None
+        assert cache.get_stats()["errors"] == 2
+
+
+class BrokenBackend:
+    """Cache backend that is always unreachable"""
+
+    async def get(self, key):
+        raise ConnectionError("backend down")
+
+    async def set(self, key, value, ttl_seconds):
+        raise ConnectionError("backend down")
+
+
+class CountingProvider(BaseLLMProvider):
+    """Provider stub that counts API calls"""
+
+    def __init__(self, make_response):
+        super().__init__(ModelProvider.LLAMA, ProviderConfig(), cache=LLMCache())
+        self.model = "llama2:13b"
+        self.make_response = make_response
+        self.calls = 0
+
+    async def _make_api_call(self, prompt, system_context=None, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return self.make_response(provider=ModelProvider.LLAMA, content=prompt)
+
+    async def validate_api_key(self):
+        return True
+
+
+class FailingProvider(CountingProvider):
+    """Provider stub whose calls fail outside the retry loop"""
+
+    async def _generate_with_retries(self, prompt, system_context, start_time, cache_key, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        raise RuntimeError("cache backend down")
+
+
+class TestRequestCoalescing:
+    """Test suite for in-flight request coalescing in BaseLLMProvider"""
+
+    @pytest.mark.asyncio
+    async def test_identical_deterministic_requests_share_one_call(self, llm_response):
+        """Test that concurrent identical temperature-0 requests make one API call"""
+        provider = CountingProvider(llm_response)
+
+        responses = await asyncio.gather(
+            *(provider.generate_decision("case", temperature=0) for _ in range(3))
+        )
+
+        assert provider.calls == 1
+        assert all(r.content == "case" for r in responses)
+        assert sum(bool(r.metadata.get("coalesced")) for r in responses) == 2
+        assert not provider._inflight
+
+    @pytest.mark.asyncio
+    async def test_sampled_requests_are_not_coalesced(self, llm_response):
+        """Test that temperature > 0 requests stay independent samples"""
+        provider = CountingProvider(llm_response)
+
+        await asyncio.gather(
+            *(provider.generate_decision("case", temperature=0.7) for _ in range(3))
+        )
+
+        assert provider.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_requests_with_different_options_not_shared(self, llm_response):
+        """Test that forwarded options such as stop are part of the cache key"""
+        provider = CountingProvider(llm_response)
+        provider._REQUEST_OPTIONS = frozenset({"max_tokens", "temperature", "stop"})
+
+        await asyncio.gather(
+            provider.generate_decision("case", temperature=0),
+            provider.generate_decision("case", temperature=0, stop=["\n"])
+        )
+        await provider.generate_decision("case", temperature=0, stop=["\n"])
+
+        assert provider.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_failing_leader_propagates_exception(self, llm_response):
+        """Test that waiters get the leader's exception, not a CancelledError"""
+        provider = FailingProvider(llm_response)
+
+        results = await asyncio.gather(
+            *(provider.generate_decision("case", temperature=0) for _ in range(3)),
+            return_exceptions=True
+        )
+
+        assert provider.calls == 1
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert not provider._inflight
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_lets_waiters_call(self, llm_response):
+        """Test that cancelling the leader doesn't cancel requests joined to it"""
+        provider = CountingProvider(llm_response)
+
+        leader = asyncio.create_task(provider.generate_decision("case", temperature=0))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(provider.generate_decision("case", temperature=0))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        response = await waiter
+
+        assert response.content == "case"
+        assert provider.calls == 2
+        assert not provider._inflight
+
+
+class TestCriteriaInstructions:
+    """Test suite for the cached structured-decision instructions"""
+
+    def test_reordered_criteria_render_in_their_own_order(self, llm_response):
+        """Test that a cached rendering is never reused for a reordered criteria dict"""
+        provider = CountingProvider(llm_response)
+
+        first = provider._criteria_instructions({"income": "< $50k", "residency": "12 months"})
+        second = provider._criteria_instructions({"residency": "12 months", "income": "< $50k"})
+
+        assert first.index("- income") < first.index("- residency")
+        assert second.index("- residency") < second.index("- income")
+        assert provider._criteria_instructions({"income": "< $50k", "residency": "12 months"}) is first
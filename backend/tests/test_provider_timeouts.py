@@ -0,0 +1,82 @@
+"""
+Unit tests for provider stream timeouts and error mapping
+"""
+import asyncio
+import httpx
+import pytest
+from openai import APIStatusError
+from types import SimpleNamespace
+from providers.base import ProviderConfig, ProviderException
+from providers.openai_provider import OpenAIProvider
+
+
+class TricklingStream:
+    """Chat completion stream that sends a chunk every 20ms, forever"""
+
+    def __init__(self):
+        self.closed = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.closed = True
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        await asyncio.sleep(0.02)
+        delta = SimpleNamespace(content="x")
+        return SimpleNamespace(
+            model="gpt-4o-mini",
+            choices=[SimpleNamespace(delta=delta, finish_reason=None)]
+        )
+
+
+class TestStreamTimeout:
+    """Test suite for the whole-response timeout in _make_api_call"""
+
+    @pytest.mark.asyncio
+    async def test_trickling_stream_times_out(self):
+        """Test that a stream that never finishes fails recoverably in time"""
+        provider = OpenAIProvider(ProviderConfig(api_key="test", timeout_seconds=0.1))
+        stream = TricklingStream()
+
+        async def create(**params):
+            return stream
+
+        provider.client = SimpleNamespace(
+            chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+        )
+
+        with pytest.raises(ProviderException) as exc_info:
+            await asyncio.wait_for(provider._make_api_call("case"), timeout=1)
+
+        assert exc_info.value.recoverable
+        assert stream.closed
+
+
+class TestServerErrors:
+    """Test suite for mapping API status errors in _make_api_call"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("status, recoverable", [(500, True), (529, True), (400, False)])
+    async def test_status_error_recoverability(self, status, recoverable):
+        """Test that 5xx and 529 responses are retried and 4xx are not"""
+        provider = OpenAIProvider(ProviderConfig(api_key="test"))
+        request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+        response = httpx.Response(status, headers={"retry-after": "2"}, request=request)
+
+        async def create(**params):
+            raise APIStatusError("status error", response=response, body=None)
+
+        provider.client = SimpleNamespace(
+            chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+        )
+
+        with pytest.raises(ProviderException) as exc_info:
+            await provider._make_api_call("case")
+
+        assert exc_info.value.recoverable is recoverable
+        assert exc_info.value.retry_after == (2.0 if recoverable else None)
@@ -0,0 +1,70 @@
+"""
+Unit tests for the semantic response cache
+"""
+import pytest
+from providers.base import ModelProvider
+
+np = pytest.importorskip("numpy")
+
+from providers import semantic_cache
+from providers.semantic_cache import SemanticCache
+
+PROMPT = """
+Unemployment Benefits Application - Case #A
+
+Applicant Details:
+- Reason for Separation: Company-wide layoff
+- Available for Work: {available}
+"""
+
+
+class ConstantEmbedder:
+    """Embeds every text to the same vector, so only the guards can reject a match"""
+
+    def encode(self, text, normalize_embeddings=True):
+        return np.ones(4, dtype=np.float32) / 2
+
+
+class TestSemanticCache:
+    """Test suite for SemanticCache class"""
+
+    @pytest.fixture
+    def cache(self, monkeypatch):
+        """Create a SemanticCache backed by the constant embedder"""
+        monkeypatch.setitem(semantic_cache._models, "constant", ConstantEmbedder())
+        return SemanticCache(model_name="constant")
+
+    @pytest.fixture
+    def response(self, llm_response):
+        """A successful response from the scoped model"""
+        return llm_response(provider=ModelProvider.OPENAI, model_name="gpt-4o-mini")
+
+    @pytest.fixture
+    def scope(self):
+        return SemanticCache.scope("openai", "gpt-4o-mini", "policy", 0.0)
+
+    @pytest.mark.asyncio
+    async def test_similar_prompt_hits(self, cache, scope, response):
+        """A matching prompt in the same scope is served from the cache"""
+        await cache.set(scope, PROMPT.format(available=True), response)
+
+        hit = await cache.get(scope, PROMPT.format(available=True))
+
+        assert hit is not None
+        assert hit.metadata["semantic_cache_hit"] is True
+
+    @pytest.mark.asyncio
+    async def test_different_boolean_field_misses(self, cache, scope, response):
+        """Prompts differing only in a True/False field never share a response"""
+        await cache.set(scope, PROMPT.format(available=True), response)
+
+        assert await cache.get(scope, PROMPT.format(available=False)) is None
+        assert cache.stats["rejected"] == 1
+
+    @pytest.mark.asyncio
+    async def test_different_scope_misses(self, cache, scope, response):
+        """Entries cached under another system context are not compared"""
+        await cache.set(scope, PROMPT.format(available=True), response)
+        other = SemanticCache.scope("openai", "gpt-4o-mini", "other policy", 0.0)
+
+        assert await cache.get(other, PROMPT.format(available=True)) is None